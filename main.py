@@ -1,12 +1,23 @@
 ### Imports ###
 
 # Standard Library Imports
+import argparse
 import os
+import sys
 import time
 
 # Local Application Imports
+import modules.catalog as catalog
 import modules.config as config
-import modules.data_io as io
+import modules.customer_journal as customer_journal
+import modules.data_io as data_io
+import modules.export_cache as export_cache
+import modules.importer as importer
+import modules.indexes as indexes
+import modules.live_report as live_report
+import modules.profiling as profiling
+import modules.sales as sales
+import modules.storage as storage
 
 ### Interface ###
 
@@ -16,6 +27,7 @@ MAIN_MENU_OPTIONS = [
     "Add Individual Sales Data",
     "Add Distributor Sales Data",
     "Manage Products",
+    "Import Sales Data",
     "Export & Exit"
 ]
 
@@ -68,7 +80,7 @@ def display_sales_data_menu_title(menu_index=None, current_day=None, person_name
 
 def add_sales_data_menu():
     # Ensure user has setup at least one product
-    if not product_names:
+    if not product_catalog:
         display_sales_data_menu_title(0)
         print("No products registered. Please add a product to begin.")
         add_new_product()
@@ -91,13 +103,10 @@ def add_sales_data_menu():
             except ValueError:
                 handle_error("Please enter a valid integer to select a region.")
 
-            customers = [
-                name for name, data in customer_data.items()
-                if data["REGION"].strip().lower() == customer_region.lower()
-            ]
+            # Already sorted by the customer index
+            customers = customer_index.customers_in_region(customer_region)
 
             display_sales_data_menu_title(0, current_day)
-            customers.sort()
             print(f"Customers in {customer_region}:")
             for i, name in enumerate(customers, start=1):
                 print(f"- {i}: {name}")
@@ -114,12 +123,13 @@ def add_sales_data_menu():
                         if not get_yes_no(f"Add '{customer_name}' to {customer_region}?"):
                             continue
 
-                        io.append_csv(config.CUSTOMER_DATA_CSV, [customer_name, customer_region, "", ""])
+                        storage.append_row(config.CUSTOMER_DATA_CSV, [customer_name, customer_region, "", ""])
                         customer_data[customer_name] = {
                             "REGION": customer_region,
                             "LOCATIONS": set(),
                             "RELATIONSHIP": ""
                         }
+                        customer_index.add_customer(customer_name, customer_region)
                         break
                     elif 1 <= customer_choice <= len(customers):
                         customer_name = customers[customer_choice - 1]
@@ -141,7 +151,7 @@ def add_sales_data_menu():
         customer_locations = customer_data[customer_name].get("LOCATIONS", set())
         while True:
             display_sales_data_menu_title(0, current_day, customer_name)
-            sorted_locations = sorted(customer_locations)
+            sorted_locations = customer_index.locations(customer_name)
 
             if customer_locations:
                 show_menu_options(sorted_locations, "Select a location")
@@ -152,7 +162,10 @@ def add_sales_data_menu():
                 choice = int(input("Choice: "))
                 if choice == 0:
                     new_location = input("Enter location name: ")
-                    customer_locations.add(new_location)
+                    if new_location not in customer_locations:
+                        customer_locations.add(new_location)
+                        customer_index.add_location(customer_name, new_location)
+                        customer_journal.record_location(customer_name, new_location)
                     location = new_location
                     break
                 elif 1 <= choice <= len(sorted_locations):
@@ -194,49 +207,27 @@ def add_sales_data_menu():
                 choice = int(input("Choice: "))
                 if 0 <= choice <= 5:
                     relationship_level = config.RELATIONSHIP_OPTIONS[choice]
-                    customer_data[customer_name]["RELATIONSHIP"] = relationship_level
+                    if relationship_level != last_relationship_value:
+                        customer_data[customer_name]["RELATIONSHIP"] = relationship_level
+                        customer_journal.record_relationship(customer_name, relationship_level)
                     break
                 else:
                     handle_error("Invalid input.")
             except ValueError:
                 handle_error("Invalid input.")
 
-        # Calculate real (actual) rate
-        total_units = sum(units for _, units, _ in products)
-        real_rate = round((total_sales / total_units), 2)
-
-        # Calculate ask (expected) rate
-        total_ask_value = sum(units * price for _, units, price in products)
-        ask_rate = round(total_ask_value / total_units, 2)
-
-        # Serialize product information
-        products_string = "|".join(
-            f"{name}:{units}:{price}" for name, units, price in products
-        )
-
-        # Export sales data
-        export_data = [
+        # Export sales data (rates and serialized products are computed in build_sale_row)
+        export_data = sales.build_sale_row(
             current_day,
             customer_name,
-            total_units,
+            products,
             total_sales,
-            real_rate,
-            ask_rate,
-            products_string,
             location,
             time_of_day,
             relationship_level
-        ]
-        io.append_csv(config.SALES_DATA_CSV, export_data)
-        sales_data.append(export_data)
-
-        # Export customer data
-        rows = []
-        for name, data in customer_data.items():
-            locations_str = "|".join(sorted(data.get("LOCATIONS", [])))
-            relationship = data.get("RELATIONSHIP", "")
-            rows.append([name, data["REGION"], locations_str, relationship])
-        io.write_csv(config.CUSTOMER_DATA_CSV, rows, headers=config.CUSTOMER_DATA_HEADERS)
+        )
+        storage.append_row(config.SALES_DATA_CSV, export_data)
+        current_report.refresh()
 
         products.clear()
         
@@ -275,14 +266,18 @@ def get_products_sold(products):
                 handle_error("Please enter a valid integer for units sold.")
         
         # Pull selected product's sell price
-        product_price = None
-        for row in product_data:
-            if row[0] == selected_product:
-                product_price = int(row[4])
-                break
+        product_price = product_catalog.price(selected_product)
         if product_price is None:
             handle_error(f"Could not find price for {selected_product}.")
             return
+
+        # Margin from the catalog's cached economics
+        economics = product_catalog.economics(selected_product)
+        print(
+            f"{selected_product}: ${product_price} each | margin ${economics.profit_per_unit:.2f} "
+            f"({economics.margin_percent(product_price):.0f}%) | "
+            f"profit ${economics.profit_per_unit * units_sold:.2f} on {units_sold} units"
+        )
         
         products.append([selected_product, units_sold, product_price])
 
@@ -332,7 +327,7 @@ def add_distributor_sales_data_menu():
                     elif not get_yes_no(f"Add {selected_distributor} to distributor list?"):
                         continue
                     else:
-                        io.append_csv(config.DISTRIBUTOR_NAMES_CSV, [selected_distributor])
+                        storage.append_row(config.DISTRIBUTOR_NAMES_CSV, [selected_distributor])
                         distributor_names.add(selected_distributor)
                         break
                 else:
@@ -347,40 +342,19 @@ def add_distributor_sales_data_menu():
         # Sales
         total_sales = get_total_sales()
 
-        if get_yes_no(f"Is {selected_distributor}'s cut already included?"):
-            gross_sales = int(total_sales / 0.8)
-            net_sales = total_sales
-        else:
-            gross_sales = total_sales
-            net_sales = int(total_sales * 0.8)
-
-        # Calculate real (actual) rate
-        total_units = sum(units for _, units, _ in products)
-        real_rate = round((gross_sales / total_units), 2)
-
-        # Calculate ask (expected) rate
-        total_ask_value = sum(units * price for _, units, price in products)
-        ask_rate = round(total_ask_value / total_units, 2)
-
-        # Serialize product information
-        products_string = "|".join(
-            f"{name}:{units}:{price}" for name, units, price in products
-        )
+        cut_included = get_yes_no(f"Is {selected_distributor}'s cut already included?")
 
-        # Export sales data
-        export_data = [
+        # Export sales data (gross/net sales and rates are computed in build_distributor_sale_row)
+        export_data = sales.build_distributor_sale_row(
             current_day,
             selected_distributor,
-            total_units,
-            gross_sales,
-            net_sales,
-            real_rate,
-            ask_rate,
-            products_string
-        ]
+            products,
+            total_sales,
+            cut_included
+        )
 
-        io.append_csv(config.DISTRIBUTOR_SALES_DATA_CSV, export_data)
-        distributor_sales_data.append(export_data)
+        storage.append_row(config.DISTRIBUTOR_SALES_DATA_CSV, export_data)
+        current_report.refresh()
 
         products.clear()
         
@@ -389,6 +363,26 @@ def add_distributor_sales_data_menu():
         if not get_yes_no("Add another distributor's sales?"):
              break
 
+### Import Sales Data Menu ###
+
+def import_sales_data_menu():
+    display_menu_title(MAIN_MENU_OPTIONS[3])
+    print("Import customer and distributor sales from a CSV or JSONL file.")
+    file_name = input("File path (blank to cancel): ").strip()
+    if not file_name:
+        return
+    if not os.path.exists(file_name):
+        handle_error(f"{file_name} not found.")
+        return
+
+    global customer_index
+    result = importer.import_sales_file(file_name, product_catalog, customer_data, distributor_names)
+    if result is not None:
+        # A bulk import can touch many customers, so the index is rebuilt once
+        customer_index = indexes.CustomerIndex(customer_data)
+        current_report.refresh()
+    input("Press Enter to return to the main menu.")
+
 ### Manage Product Menu ###
 
 def manage_product_menu():
@@ -428,26 +422,21 @@ def add_new_product():
     while True:
         # Set product information
         product_name = set_product_name()
+        if product_name is None:
+            return
         materials = set_product_materials(materials)
         timeframe = set_product_timeframe()
         yield_amount = set_product_yield_amount()
         sell_price = set_product_price()
 
-        # Serialize material information
-        materials_string = "|".join(
-            f"{name}:{amount}:{price}" for name, amount, price in materials
-        )
-
         # Store and save product information
-        export_data = [
-            product_name,
-            materials_string,
-            timeframe,
-            yield_amount,
-            sell_price
-        ]
-        io.append_csv(config.PRODUCT_DATA_CSV, export_data)
-        product_data.append(export_data)
+        product_catalog.add(catalog.Product(
+            name=product_name,
+            materials=materials,
+            timeframe=timeframe,
+            yield_amount=yield_amount,
+            sell_price=sell_price
+        ))
 
         if not get_yes_no("Add another product?"):
             break
@@ -459,12 +448,10 @@ def set_product_name(current_name=None):
 
     while True:
             product_name = input(prompt)
-            if product_name in product_names:
+            if product_name in product_catalog:
                 handle_error("Product already exists.")
                 return
             else:
-                io.append_csv(config.PRODUCT_NAMES_CSV, [product_name])
-                product_names.add(product_name)
                 break
 
     return product_name
@@ -559,11 +546,11 @@ def set_product_price(current_price=None):
     return product_price    
 
 def select_product():
-    if not product_names:
+    if not product_catalog:
         handle_error("No products available.")
         return
     
-    product_list = sorted(product_names)
+    product_list = product_catalog.names()
     print("Select a product: ")
     for i, name in enumerate(product_list, start=1):
         print(f"- {i}: {name}")
@@ -620,65 +607,41 @@ def edit_product_name(selected_product):
     clear_screen()
     print(f"Selected Product: {selected_product}")
     new_name = set_product_name(selected_product)
+    if new_name is None:
+        return
 
-    # Update the product names list
-    if selected_product in product_names:
-        product_names.remove(selected_product)
-    product_names.add(new_name)
-
-    # Update the relevant CSV files
-    updated_names = [[name] for name in sorted(product_names)]
-    io.write_csv(config.PRODUCT_NAMES_CSV, updated_names, headers=["PRODUCT"])
-    save_product_edit_changes(selected_product, 0, new_name)
+    save_product_edit_changes(selected_product, name=new_name)
 
 def edit_product_price(selected_product):
     clear_screen()
     print(f"Selected Product: {selected_product}")
 
-    for row in product_data:
-        if row[0] == selected_product:
-            current_price = int(row[4])
-            break
-
+    current_price = product_catalog.get(selected_product).sell_price
     new_price = set_product_price(current_price)
-    save_product_edit_changes(selected_product, 4, new_price)
+    save_product_edit_changes(selected_product, sell_price=new_price)
 
 def edit_product_materials(selected_product):
     clear_screen()
     print(f"Selected Product: {selected_product}")
     
     new_materials = set_product_materials([])
-
-    # Serialize materials list
-    materials_string = "|".join(
-        f"{name}:{amount}:{price}" for name, amount, price in new_materials
-    )
-
-    save_product_edit_changes(selected_product, 1, materials_string)
+    save_product_edit_changes(selected_product, materials=new_materials)
 
 def edit_product_timeframe(selected_product):
     clear_screen()
     print(f"Selected Product: {selected_product}")
 
-    for row in product_data:
-        if row[0] == selected_product:
-            current_timeframe = int(row[2])
-            break
-    
+    current_timeframe = product_catalog.get(selected_product).timeframe
     new_timeframe = set_product_timeframe(current_timeframe)
-    save_product_edit_changes(selected_product, 2, new_timeframe)
+    save_product_edit_changes(selected_product, timeframe=new_timeframe)
 
 def edit_product_yield_amount(selected_product):
     clear_screen()
     print(f"Selected Product: {selected_product}")
 
-    for row in product_data:
-        if row[0] == selected_product:
-            current_yield = int(row[3])
-            break
-    
+    current_yield = product_catalog.get(selected_product).yield_amount
     new_yield = set_product_yield_amount(current_yield)
-    save_product_edit_changes(selected_product, 3, new_yield)
+    save_product_edit_changes(selected_product, yield_amount=new_yield)
 
 def delete_product(selected_product):
     clear_screen()
@@ -686,68 +649,142 @@ def delete_product(selected_product):
     if not get_yes_no(f"Delete {selected_product}?"):
         return
     
-    product_names.remove(selected_product)
-
-    # Modify product_names.csv
-    updated_names = [[name] for name in product_names]
-    io.write_csv(config.PRODUCT_NAMES_CSV, updated_names, headers=["PRODUCT"])
-
-    # Modify product_data.csv
-    updated_product_data = [
-        row for row in product_data[1:] if row[0] != selected_product
-    ]
-    io.write_csv(config.PRODUCT_DATA_CSV, updated_product_data, headers=config.PRODUCT_DATA_HEADERS)
-
-    # Update in-memory list
-    product_data.clear()
-    product_data.extend(updated_product_data)
+    # Updates product_data.csv and product_names.csv
+    product_catalog.delete(selected_product)
 
     print(f"{selected_product} deleted successfully.")
     time.sleep(1)
     clear_screen()
 
-def save_product_edit_changes(selected_product, row_number, new_value):
-    # Update in-memory list
-    for row in product_data:
-        if row[0] == selected_product:
-            row[row_number] = new_value
-            # Update name if changed
-            if row_number == 0:
-                selected_product = new_value
-            break
-    
-    io.write_csv(config.PRODUCT_DATA_CSV, product_data[1:], headers=config.PRODUCT_DATA_HEADERS)
-    
-    print(f"{selected_product} updated.")
+def save_product_edit_changes(selected_product, **changes):
+    # Update the catalog and its CSV files
+    product = product_catalog.update(selected_product, **changes)
+
+    print(f"{product.name} updated.")
     time.sleep(1)
     clear_screen()
 
 ### Initialization ###
 
-def initialize():
-    global sales_data, distributor_sales_data, product_data, customer_data, product_names, distributor_names
-    sales_data = io.load_or_create_list_csv(config.SALES_DATA_CSV, config.RAW_DATA_REPORT_HEADERS)
-    distributor_sales_data = io.load_or_create_list_csv(config.DISTRIBUTOR_SALES_DATA_CSV, config.RAW_DISTRIBUTOR_DATA_REPORT_HEADERS)
-    product_data = io.load_or_create_list_csv(config.PRODUCT_DATA_CSV, config.PRODUCT_DATA_HEADERS)
-    customer_data = io.load_or_create_dict_csv(
-        file_name=config.CUSTOMER_DATA_CSV,
-        headers=config.CUSTOMER_DATA_HEADERS,
-        key_field="CUSTOMER"
-    )
-    product_names = io.load_or_create_set_csv(config.PRODUCT_NAMES_CSV, ["PRODUCT"])
-    distributor_names = io.load_or_create_set_csv(config.DISTRIBUTOR_NAMES_CSV, ["DISTRIBUTOR"])
+# Export aggregates kept current as sales are recorded (None until initialize)
+current_report = None
+
+def initialize(with_live_report=True):
+    global product_catalog, customer_data, customer_index, distributor_names, current_report
+    with profiling.stage("initialize"):
+        # Sales logs are only appended to here; exports stream them from storage
+        with profiling.stage("check_sales_logs"):
+            storage.ensure_exists(config.SALES_DATA_CSV, config.RAW_DATA_REPORT_HEADERS)
+            storage.ensure_exists(config.DISTRIBUTOR_SALES_DATA_CSV, config.RAW_DISTRIBUTOR_DATA_REPORT_HEADERS)
+        with profiling.stage("load_products"):
+            product_catalog = catalog.load_product_catalog()
+        with profiling.stage("load_customers"):
+            customer_data = customer_journal.load_customer_data()
+            customer_index = indexes.CustomerIndex(customer_data)
+        with profiling.stage("load_distributors"):
+            distributor_names = storage.load_set(config.DISTRIBUTOR_NAMES_CSV, ["DISTRIBUTOR"])
+        if with_live_report:
+            with profiling.stage("load_live_report"):
+                current_report = live_report.LiveReport(storage.get_storage())
+
+### Export ###
+
+def export_reports(
+    output_file=None,
+    figures_dir=None,
+    figure_format=None,
+    write_only=None,
+    incremental=True,
+    include_figures=True,
+    interactive=True,
+    day_window=None,
+    parallel=None,
+    use_cache=True,
+    formats=None,
+    tables_dir=None,
+    report=None
+):
+    # report: aggregates already built (the live report), so the export only renders them
+    if output_file is None:
+        output_file = config.BUSINESS_REPORT
+    if formats is None:
+        formats = config.EXPORT_FORMATS
+    store = storage.get_storage()
+    # Sheets and figures whose inputs and settings are unchanged since the last export are skipped
+    cache = export_cache.ExportCache(store, day_window) if use_cache else None
+
+    if "xlsx" in formats:
+        with profiling.stage("export_spreadsheet"):
+            if cache is not None and cache.workbook_is_current(output_file):
+                print(f"{output_file} is up to date.")
+            else:
+                # openpyxl is only imported once the workbook has to be written
+                import modules.excel_report as excel_report
+                report = excel_report.export_spreadsheet(
+                    write_only=write_only,
+                    incremental=incremental,
+                    output_file=output_file,
+                    interactive=interactive,
+                    day_window=day_window,
+                    parallel=parallel,
+                    cache=cache,
+                    report=report
+                )
+
+    for table_format in ["parquet", "arrow"]:
+        if table_format in formats:
+            # pyarrow is optional, so it is only imported for these formats
+            import modules.columnar as columnar
+            with profiling.stage(f"export_{table_format}"):
+                report = columnar.export_tables(tables_dir, table_format, report, incremental, day_window)
+
+    if not include_figures:
+        return
 
-    # Convert locations string to set for in-memory use
-    for customer, data in customer_data.items():
-        loc_string = data.get("LOCATIONS", "")
-        data["LOCATIONS"] = set(loc_string.split("|")) if loc_string else set()
+    # matplotlib is only imported once a figure has to be rendered
+    import modules.figures as figures
+    import modules.aggregation as aggregation
 
+    with profiling.stage("export_figures"):
+        daily_figures = [
+            figure for figure in config.DAILY_FIGURES
+            if cache is None or not cache.figure_is_current(
+                figure, figures.figure_output_path(figure["file"], figures_dir, figure_format)
+            )
+        ]
+        if not daily_figures:
+            print("Figures are up to date.")
+            return
+        if report is None:
+            with profiling.stage("aggregate"):
+                report = store.build_report_data(incremental=incremental, day_window=day_window)
+        figures.export_figures(
+            aggregation.daily_summary_columns(report),
+            output_dir=figures_dir,
+            figure_format=figure_format,
+            daily_figures=daily_figures
+        )
+        if cache is not None:
+            for figure in daily_figures:
+                cache.record_figure(figure, figures.figure_output_path(figure["file"], figures_dir, figure_format))
+            cache.save()
 
 ### Main Loop ###
 
+def show_day_totals():
+    # Read straight from the live report, so this costs nothing per menu draw
+    day = current_report.latest_day()
+    if day is None:
+        return
+    data = current_report.day_summary(day)
+    total_sales = data["my_sales"] + data["distributor_sales"]
+    total_units = data["my_units_sold"] + data["distributor_units_sold"]
+    print(f"= Day {day}: ${total_sales:,.2f} | {total_units} units | {data['deals']} deals =")
+
 def main_menu_loop():
     while True:
         display_menu_title(APP_NAME)
+        show_day_totals()
         show_menu_options(MAIN_MENU_OPTIONS)
 
         choice = int(input("Choice: "))
@@ -759,17 +796,167 @@ def main_menu_loop():
             case 3:
                 manage_product_menu()
             case 4:
+                import_sales_data_menu()
+            case 5:
                 clear_screen()
-                io.export_spreadsheet()
-                io.export_figures()
+                current_report.refresh()
+                current_report.save()
+                export_reports(report=current_report.report)
                 print("Closing program.")
                 break
             case _:
                 handle_error("Invalid input.")
 
+### Command Line ###
+
+def parse_day_range(text):
+    # "40-60", "40-" (day 40 on), "-60" (up to day 60) or "45" (one day)
+    first, separator, last = text.partition("-")
+    try:
+        first_day = int(first) if first else None
+        last_day = int(last) if last else None
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid day range: {text}")
+    if not separator:
+        last_day = first_day
+    if first_day is None and last_day is None:
+        raise argparse.ArgumentTypeError(f"invalid day range: {text}")
+    return first_day, last_day
+
+def add_day_window_arguments(subparser):
+    day_group = subparser.add_mutually_exclusive_group()
+    day_group.add_argument("--days", type=parse_day_range, metavar="FIRST-LAST", help="only report these days")
+    day_group.add_argument("--last-days", type=int, metavar="N", help="only report the last N logged days")
+
+def day_window_from_args(args):
+    first_day, last_day = args.days or (None, None)
+    return storage.resolve_day_window(first_day, last_day, args.last_days)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description=f"{APP_NAME}. Run without a command for the interactive menus."
+    )
+    parser.add_argument("--profile", action="store_true", help="print wall time, CPU time and peak memory per stage")
+    parser.add_argument("--profile-trace", metavar="JSON", help=f"stage trace file (default: {config.PROFILE_TRACE})")
+    parser.add_argument("--cprofile", metavar="FILE", help="also write cProfile stats to FILE")
+    subparsers = parser.add_subparsers(dest="command")
+
+    export_parser = subparsers.add_parser("export", help="export the business report and figures")
+    export_parser.add_argument("--output", default=config.BUSINESS_REPORT, help="workbook path")
+    export_parser.add_argument(
+        "--format", nargs="+", choices=["xlsx", "parquet", "arrow"], default=config.EXPORT_FORMATS,
+        help="outputs to write; parquet and arrow write typed tables (needs pyarrow)"
+    )
+    export_parser.add_argument(
+        "--tables-dir", default=config.COLUMNAR_EXPORT_DIRECTORY, help="directory for parquet or arrow tables"
+    )
+    export_parser.add_argument("--figures-dir", help="directory for figures (default: paths in config)")
+    export_parser.add_argument("--figure-format", choices=["png", "svg", "pdf"], help="figure file format")
+    export_parser.add_argument("--streaming", action="store_true", help="use the write-only workbook")
+    export_parser.add_argument("--parallel", action="store_true", help="write the log sheets in worker processes")
+    export_parser.add_argument("--full", action="store_true", help="ignore the export checkpoint and cache")
+    export_parser.add_argument("--no-cache", action="store_true", help="rebuild sheets and figures even if unchanged")
+    export_parser.add_argument("--no-figures", action="store_true", help="skip figures")
+    add_day_window_arguments(export_parser)
+
+    figures_parser = subparsers.add_parser("figures", help="render the daily figures")
+    figures_parser.add_argument("--figures-dir", help="directory for figures (default: paths in config)")
+    figures_parser.add_argument("--figure-format", choices=["png", "svg", "pdf"], help="figure file format")
+    figures_parser.add_argument("--from-report", metavar="XLSX", help="read daily data from an exported workbook")
+    add_day_window_arguments(figures_parser)
+
+    import_parser = subparsers.add_parser("import", help="import sales from CSV or JSONL files")
+    import_parser.add_argument("files", nargs="+", help="files to import")
+
+    args = parser.parse_args(argv)
+    if args.command == "export" and {"parquet", "arrow"} <= set(args.format):
+        # Both would share one tables directory and manifest
+        parser.error("choose either parquet or arrow tables, not both")
+    return args
+
+def run_command(args):
+    # Headless commands never clear the screen or prompt
+    match args.command:
+        case "export":
+            try:
+                export_reports(
+                    output_file=args.output,
+                    figures_dir=args.figures_dir,
+                    figure_format=args.figure_format,
+                    write_only=True if args.streaming else None,
+                    incremental=not args.full,
+                    include_figures=not args.no_figures,
+                    interactive=False,
+                    day_window=day_window_from_args(args),
+                    parallel=True if args.parallel else None,
+                    use_cache=not (args.full or args.no_cache),
+                    formats=args.format,
+                    tables_dir=args.tables_dir
+                )
+            except PermissionError:
+                print(f"Unable to save {args.output}. Check to see if it is open in another program.")
+                return 1
+            except ImportError as error:
+                print(f"{error.name} is required for this export format (pip install {error.name}).")
+                return 1
+        case "figures":
+            import modules.figures as figures
+            import modules.aggregation as aggregation
+
+            day_window = day_window_from_args(args)
+            daily_summary = None
+            if args.from_report is None:
+                with profiling.stage("aggregate"):
+                    report = storage.get_storage().build_report_data(day_window=day_window)
+                daily_summary = aggregation.daily_summary_columns(report)
+            with profiling.stage("export_figures"):
+                figures.export_figures(
+                    daily_summary,
+                    output_dir=args.figures_dir,
+                    figure_format=args.figure_format,
+                    report_file=args.from_report,
+                    day_window=day_window
+                )
+        case "import":
+            missing = [file_name for file_name in args.files if not os.path.exists(file_name)]
+            if missing:
+                for file_name in missing:
+                    print(f"{file_name} not found.")
+                return 1
+            initialize(with_live_report=False)
+            try:
+                failed = [
+                    file_name for file_name in args.files
+                    if importer.import_sales_file(file_name, product_catalog, customer_data, distributor_names) is None
+                ]
+            finally:
+                customer_journal.compact_customer_journal()
+            if failed:
+                return 1
+    return 0
+
 if __name__ == "__main__":
+    args = parse_args()
+    if args.profile or args.profile_trace or args.cprofile or config.PROFILE_STAGES:
+        profiling.enable(trace=args.profile_trace or config.PROFILE_TRACE, profile=args.cprofile)
+
+    if args.command is not None:
+        try:
+            exit_code = run_command(args)
+        finally:
+            profiling.finish()
+        sys.exit(exit_code)
+
     try:
         initialize()
         main_menu_loop()
     except KeyboardInterrupt:
         print("\nClosing program.")
+    finally:
+        # Fold the customer journal back into customer_data.csv on the way out
+        customer_journal.compact_customer_journal()
+        if current_report is not None:
+            current_report.save()
+        # Buffered sales rows are written even if the session was interrupted
+        data_io.close_appends()
+        profiling.finish()
@@ -0,0 +1,299 @@
+# Standard Library Imports
+import os
+import io
+import csv
+import json
+import hashlib
+from collections import Counter, defaultdict
+
+# Local Application Imports
+import modules.config as config
+import modules.data_io as data_io
+import modules.records as records
+import modules.sketch as sketch
+
+### Aggregation ###
+
+def new_customer_day_summary():
+    return {"sales": 0.0, "units": 0}
+
+def new_day_summary():
+    return {
+        "my_sales": 0.0,
+        "distributor_sales": 0.0,
+        "my_units_sold": 0,
+        "distributor_units_sold": 0,
+        "deals": 0,
+        "products": Counter(),
+        "distributor_products": Counter(),
+        "customer_data": defaultdict(new_customer_day_summary)
+    }
+
+def new_customer_summary():
+    return {
+        "total_sales": 0.0,
+        "units_total": 0,
+        "deals": 0,
+        "rate_total": 0.0,
+        "sale_sketch": sketch.QuantileSketch(),
+        "rate_sketch": sketch.QuantileSketch(),
+        "relationship": "",
+        "times_of_day": Counter(),
+        "locations": Counter()
+    }
+
+def new_product_summary():
+    return {"sales": 0.0, "units": 0}
+
+def new_report_data():
+    return {
+        "daily": defaultdict(new_day_summary),
+        "customers": defaultdict(new_customer_summary),
+        "products": defaultdict(new_product_summary)
+    }
+
+def add_sale(report, sale):
+    current_day = sale.day
+    customer_name = sale.customer
+    units_sold = sale.units_sold
+    total_sales = sale.total_sales
+    real_rate = sale.real_rate
+    location = sale.location
+    time_of_day = sale.time_of_day
+    relationship = sale.relationship
+
+    # Largest product first for every summary
+    parsed_products = sorted(sale.products, key=lambda x: x[1], reverse=True)
+
+    # Daily summary
+    day_summary = report["daily"][current_day]
+    day_summary["my_units_sold"] += units_sold
+    day_summary["deals"] += 1
+    day_summary["my_sales"] += total_sales
+    for name, units, _ in parsed_products:
+        day_summary["products"][name] += units
+    cust_data = day_summary["customer_data"][customer_name]
+    cust_data["sales"] += total_sales
+    cust_data["units"] += units_sold
+
+    # Customer summary
+    customer = report["customers"][customer_name]
+    customer["total_sales"] += total_sales
+    customer["units_total"] += units_sold
+    customer["deals"] += 1
+    customer["rate_total"] += real_rate
+    customer["sale_sketch"].add(total_sales)
+    customer["rate_sketch"].add(real_rate)
+    customer["relationship"] = relationship
+    customer["times_of_day"][time_of_day] += 1
+    customer["locations"][location] += 1
+
+    # Product summary (sale total split by each product's share of units)
+    total_units_in_sale = sum(units for _, units, _ in parsed_products)
+    for name, units, _ in parsed_products:
+        portion = units / total_units_in_sale if total_units_in_sale else 0
+        product = report["products"][name]
+        product["sales"] += total_sales * portion
+        product["units"] += units
+
+def add_distributor_sale(report, sale):
+    current_day = sale.day
+    units_sold = sale.units_sold
+    gross_sales = sale.gross_sales
+    parsed_products = sale.products
+
+    # Daily summary
+    day_summary = report["daily"][current_day]
+    day_summary["distributor_units_sold"] += units_sold
+    day_summary["distributor_sales"] += gross_sales
+    for name, units, _ in parsed_products:
+        day_summary["distributor_products"][name] += units
+
+def build_report_data(sales, distributor_sales):
+    # Takes iterables of sale records (see modules/records.py), so logs can be streamed
+    report = new_report_data()
+
+    # Single pass over each log
+    for sale in sales:
+        add_sale(report, sale)
+    for sale in distributor_sales:
+        add_distributor_sale(report, sale)
+
+    return report
+
+### Checkpoints ###
+
+CHECKPOINT_VERSION = 4
+CHECKPOINT_HASH_CHUNK = 1024 * 1024
+
+def report_to_json(report):
+    return {
+        "daily": {str(day): data for day, data in report["daily"].items()},
+        "customers": {
+            name: {
+                **data,
+                "sale_sketch": data["sale_sketch"].to_json(),
+                "rate_sketch": data["rate_sketch"].to_json()
+            }
+            for name, data in report["customers"].items()
+        },
+        "products": report["products"]
+    }
+
+def report_from_json(data):
+    report = new_report_data()
+
+    for day, day_data in data["daily"].items():
+        day_summary = report["daily"][int(day)]
+        day_summary.update(day_data)
+        day_summary["products"] = Counter(day_data["products"])
+        day_summary["distributor_products"] = Counter(day_data["distributor_products"])
+        day_summary["customer_data"] = defaultdict(new_customer_day_summary, day_data["customer_data"])
+
+    for name, customer_data in data["customers"].items():
+        customer = report["customers"][name]
+        customer.update(customer_data)
+        customer["times_of_day"] = Counter(customer_data["times_of_day"])
+        customer["locations"] = Counter(customer_data["locations"])
+        customer["sale_sketch"] = sketch.QuantileSketch.from_json(customer_data["sale_sketch"])
+        customer["rate_sketch"] = sketch.QuantileSketch.from_json(customer_data["rate_sketch"])
+
+    for name, product_data in data["products"].items():
+        report["products"][name].update(product_data)
+
+    return report
+
+def hash_file_prefix(file_name, offset):
+    # Hashes every byte already processed, read in chunks so a large log never sits in memory
+    digest = hashlib.sha1()
+    with open(file_name, mode="rb") as file:
+        remaining = offset
+        while remaining > 0:
+            chunk = file.read(min(remaining, CHECKPOINT_HASH_CHUNK))
+            if not chunk:
+                break
+            digest.update(chunk)
+            remaining -= len(chunk)
+    return digest.hexdigest()
+
+def get_file_state(file_name, offset):
+    # Fingerprint of everything already processed, so a rewrite anywhere in it is detected
+    data_io.flush_appends(file_name)
+    return {"offset": offset, "prefix_hash": hash_file_prefix(file_name, offset)}
+
+def is_append_of(file_name, state):
+    data_io.flush_appends(file_name)
+    if not os.path.exists(file_name) or os.path.getsize(file_name) < state["offset"]:
+        return False
+    return get_file_state(file_name, state["offset"]) == state
+
+def read_rows_from_offset(file_name, offset):
+    # Yield rows appended after offset (skipping the header on a fresh read)
+    with open(file_name, mode="rb") as binary_file:
+        binary_file.seek(offset)
+        with io.TextIOWrapper(binary_file, newline="") as file:
+            reader = csv.reader(file)
+            if offset == 0:
+                next(reader, None)
+            for row in reader:
+                if row:
+                    yield row
+
+def load_checkpoint(file_name):
+    if not os.path.exists(file_name):
+        return None
+    try:
+        with open(file_name, mode="r") as file:
+            checkpoint = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if checkpoint.get("version") != CHECKPOINT_VERSION:
+        return None
+    return checkpoint
+
+def save_checkpoint(file_name, report, file_states):
+    checkpoint = {
+        "version": CHECKPOINT_VERSION,
+        "files": file_states,
+        "report": report_to_json(report)
+    }
+
+    # Write to a temporary file first so an interrupted save never corrupts the checkpoint
+    temp_file_name = file_name + ".tmp"
+    with open(temp_file_name, mode="w") as file:
+        json.dump(checkpoint, file)
+    os.replace(temp_file_name, file_name)
+
+def report_sources(sales_files, distributor_files):
+    # (file, fold function, record reader) for every file; each log may be one file or several
+    # (day partitions), and every file is tracked separately
+    sources = [(file_name, add_sale, records.sale_records) for file_name in sales_files]
+    sources += [
+        (file_name, add_distributor_sale, records.distributor_sale_records)
+        for file_name in distributor_files
+    ]
+    return sources
+
+def resume_report(sources, checkpoint_file):
+    # Returns the checkpointed report and the log offsets it covers, or an empty report
+    source_files = {file_name for file_name, _, _ in sources}
+    checkpoint = load_checkpoint(checkpoint_file)
+
+    # Resume from the checkpoint only if every file it covers is still a source and was purely
+    # appended to since; files it has not seen yet (new partitions) are read from the start
+    if checkpoint is not None and all(
+        file_name in source_files and is_append_of(file_name, state)
+        for file_name, state in checkpoint["files"].items()
+    ):
+        print("Resuming from export checkpoint.")
+        offsets = {file_name: state["offset"] for file_name, state in checkpoint["files"].items()}
+        return report_from_json(checkpoint["report"]), offsets
+
+    if checkpoint is not None:
+        print("Sales logs were rewritten. Rebuilding export checkpoint.")
+    return new_report_data(), {}
+
+def fold_appended_rows(report, sources, offsets):
+    # Folds in the rows after each file's offset; returns the new offsets
+    new_offsets = {}
+    for file_name, add_record, to_records in sources:
+        # Buffered appends are written first, so the end offset covers whole rows only
+        data_io.flush_appends(file_name)
+        if not os.path.exists(file_name):
+            continue
+        end_offset = os.path.getsize(file_name)
+        offset = offsets.get(file_name, 0)
+        if end_offset != offset:
+            for record in to_records(read_rows_from_offset(file_name, offset)):
+                add_record(report, record)
+        new_offsets[file_name] = end_offset
+    return new_offsets
+
+def checkpoint_file_states(offsets):
+    return {file_name: get_file_state(file_name, offset) for file_name, offset in offsets.items()}
+
+def build_incremental_report_data(sales_files, distributor_files, checkpoint_file):
+    sources = report_sources(sales_files, distributor_files)
+    report, offsets = resume_report(sources, checkpoint_file)
+    # Fold in only the rows appended since the last export
+    offsets = fold_appended_rows(report, sources, offsets)
+    save_checkpoint(checkpoint_file, report, checkpoint_file_states(offsets))
+    return report
+
+### Figures Data ###
+
+def daily_summary_columns(report):
+    # Numeric Daily Summary columns as plain arrays, keyed like the sheet headers
+    columns = {header: [] for header in config.DAILY_SUMMARY_HEADERS[:8]}
+    daily_summary = report["daily"]
+    for day in sorted(daily_summary):
+        data = daily_summary[day]
+        columns["DAY"].append(day)
+        columns["TOTAL SALES"].append(round(data["my_sales"] + data["distributor_sales"], 2))
+        columns["MY SALES"].append(round(data["my_sales"], 2))
+        columns["DISTR SALES"].append(round(data["distributor_sales"], 2))
+        columns["TOTAL UNITS"].append(data["my_units_sold"] + data["distributor_units_sold"])
+        columns["MY UNITS"].append(data["my_units_sold"])
+        columns["DISTR UNITS"].append(data["distributor_units_sold"])
+        columns["DEALS"].append(data["deals"])
+    return columns
@@ -0,0 +1,144 @@
+# Standard Library Imports
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+# Third-Party Library Imports
+from openpyxl import Workbook
+
+# Local Application Imports
+import modules.aggregation as aggregation
+import modules.catalog as catalog
+import modules.config as config
+import modules.excel_report as excel_report
+import modules.figures as figures
+import modules.records as records
+import modules.storage as storage
+import modules.styles as styles
+import modules.synthetic_data as synthetic_data
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+### Stages ###
+
+def run_stage(results, rows, stage, function, trace_memory):
+    # Load messages from the CSV helpers are suppressed so the summary stays readable
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        value = function()
+    seconds = time.perf_counter() - start
+    peak_memory = None
+    if trace_memory:
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    results.append({
+        "rows": rows,
+        "stage": stage,
+        "seconds": round(seconds, 4),
+        "peak_memory_bytes": peak_memory
+    })
+    print(f"{rows:>10} {stage:<32} {seconds:>9.3f}s" + (f" {peak_memory / 2**20:>9.1f} MiB" if trace_memory else ""))
+    return value
+
+def benchmark_size(rows, trace_memory, include_figures, write_only):
+    results = []
+    store = storage.CsvStorage()
+    wb = Workbook(write_only=write_only)
+    if not write_only:
+        wb.remove(wb.active)
+    styles.register_report_styles(wb)
+
+    products = run_stage(results, rows, "load_products", lambda: catalog.load_product_catalog(store), trace_memory)
+
+    # The logs are streamed as records, as in export_spreadsheet
+    report = run_stage(results, rows, "aggregate", lambda: aggregation.build_report_data(
+        records.iter_sales(store), records.iter_distributor_sales(store)
+    ), trace_memory)
+    try:
+        import modules.vectorized as vectorized
+    except ImportError:
+        vectorized = None
+    if vectorized is not None:
+        run_stage(results, rows, "aggregate_pandas", vectorized.build_report_data_from_csv, trace_memory)
+
+    sheets = [
+        ("build_daily_summary_sheet", config.DAILY_SUMMARY_REPORT_NAME,
+         lambda ws: excel_report.build_daily_summary_sheet(ws, report)),
+        ("build_distributor_summary_sheet", config.DISTRIBUTOR_SUMMARY_REPORT_NAME,
+         lambda ws: excel_report.build_distributor_summary_sheet(ws, records.iter_distributor_sales(store))),
+        ("build_customer_summary_sheet", config.CUSTOMER_SUMMARY_REPORT_NAME,
+         lambda ws: excel_report.build_customer_summary_sheet(ws, report)),
+        ("build_product_summary_sheet", config.PRODUCT_SUMMARY_REPORT_NAME,
+         lambda ws: excel_report.build_product_summary_sheet(ws, products, report)),
+        ("build_raw_data_sheet", config.RAW_DATA_REPORT_NAME,
+         lambda ws: excel_report.build_raw_data_sheet(ws, records.iter_sales(store))),
+    ]
+    for stage, title, build in sheets:
+        ws = wb.create_sheet(title=title)
+        run_stage(results, rows, stage, lambda: build(ws), trace_memory)
+    run_stage(results, rows, "save_workbook", lambda: wb.save(config.BUSINESS_REPORT), trace_memory)
+
+    if include_figures:
+        run_stage(results, rows, "export_figures", lambda: figures.export_figures(
+            aggregation.daily_summary_columns(report)
+        ), trace_memory)
+
+    return results
+
+### Runner ###
+
+def run_benchmarks(sizes, seed=0, trace_memory=True, include_figures=True, write_only=False):
+    results = []
+    original_directory = os.getcwd()
+    for rows in sizes:
+        # Each size runs in its own scratch directory, since config paths are relative
+        with tempfile.TemporaryDirectory(prefix="bench_") as directory:
+            start = time.perf_counter()
+            synthetic_data.generate_dataset(directory, rows, seed=seed)
+            print(f"{rows:>10} {'generate_data':<32} {time.perf_counter() - start:>9.3f}s")
+            os.chdir(directory)
+            try:
+                results.extend(benchmark_size(rows, trace_memory, include_figures, write_only))
+            finally:
+                os.chdir(original_directory)
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "trace_memory": trace_memory,
+        "write_only": write_only,
+        "results": results
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time and measure each export stage on synthetic data.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="sale rows per run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON results file")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc (it slows every stage)")
+    parser.add_argument("--no-figures", action="store_true", help="skip the figures stage")
+    parser.add_argument("--streaming", action="store_true", help="use the write-only workbook")
+    args = parser.parse_args()
+
+    output = run_benchmarks(
+        args.sizes,
+        seed=args.seed,
+        trace_memory=not args.no_memory,
+        include_figures=not args.no_figures,
+        write_only=args.streaming
+    )
+    with open(args.output, mode="w") as file:
+        json.dump(output, file, indent=2)
+    print(f"{args.output} written.")
@@ -0,0 +1,206 @@
+# Standard Library Imports
+import json
+import os
+from dataclasses import asdict, dataclass, field
+
+# Local Application Imports
+import modules.config as config
+import modules.export_cache as export_cache
+import modules.storage as storage
+
+### Products ###
+
+def parse_materials(materials_string):
+    return [
+        [name, int(amount), int(price)]
+        for entry in materials_string.split("|") if entry
+        for name, amount, price in [entry.split(":")]
+    ]
+
+def serialize_materials(materials):
+    return "|".join(
+        f"{name}:{amount}:{price}" for name, amount, price in materials
+    )
+
+@dataclass
+class Product:
+    name: str
+    materials: list = field(default_factory=list)
+    timeframe: int = 1
+    yield_amount: int = 1
+    sell_price: int = 0
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(
+            name=row[0],
+            materials=parse_materials(row[1]),
+            timeframe=int(row[2]),
+            yield_amount=int(row[3]),
+            sell_price=int(row[4])
+        )
+
+    def to_row(self):
+        return [
+            self.name,
+            serialize_materials(self.materials),
+            self.timeframe,
+            self.yield_amount,
+            self.sell_price
+        ]
+
+    def materials_cost(self):
+        return sum(amount * price for _, amount, price in self.materials)
+
+### Economics ###
+
+@dataclass
+class ProductEconomics:
+    materials_cost_per_unit: float
+    profit_per_unit: float
+    profit_per_batch: float
+    profit_per_hour: float
+
+    @classmethod
+    def of(cls, product):
+        materials_cost_per_unit = product.materials_cost() / product.yield_amount
+        profit_per_unit = product.sell_price - materials_cost_per_unit
+        profit_per_batch = profit_per_unit * product.yield_amount
+        profit_per_hour = profit_per_batch / product.timeframe if product.timeframe > 0 else 0
+        return cls(materials_cost_per_unit, profit_per_unit, profit_per_batch, profit_per_hour)
+
+    def margin_percent(self, sell_price):
+        return self.profit_per_unit / sell_price * 100 if sell_price else 0
+
+def product_data_state(store):
+    # Size and modification time of wherever the product data is stored
+    return {
+        file_name: export_cache.file_state(file_name)
+        for file_name in store.stored_files(config.PRODUCT_DATA_CSV)
+    }
+
+def load_economics(file_name):
+    # The saved catalog with its economics, and the product data state it was saved at
+    try:
+        with open(file_name, mode="r") as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+### Catalog ###
+
+class ProductCatalog:
+    # Products keyed by name (kept in product_data.csv order); every change is saved
+    # to product_data.csv and product_names.csv. Each product's economics are kept alongside
+    # (and in economics_file), and only recomputed when the product is added or edited.
+    def __init__(self, products=(), economics_file=None, product_economics=None, store=None):
+        self.products = {product.name: product for product in products}
+        self.economics_file = economics_file
+        self.store = store
+        self.product_economics = dict(product_economics or {})
+        for product in self:
+            if product.name not in self.product_economics:
+                self.product_economics[product.name] = ProductEconomics.of(product)
+
+    def __contains__(self, name):
+        return name in self.products
+
+    def __iter__(self):
+        return iter(self.products.values())
+
+    def __len__(self):
+        return len(self.products)
+
+    def get(self, name):
+        return self.products.get(name)
+
+    def names(self):
+        return sorted(self.products)
+
+    def price(self, name):
+        product = self.products.get(name)
+        return product.sell_price if product else None
+
+    def economics(self, name):
+        return self.product_economics.get(name)
+
+    def add(self, product):
+        self.products[product.name] = product
+        self.product_economics[product.name] = ProductEconomics.of(product)
+        storage.append_row(config.PRODUCT_DATA_CSV, product.to_row())
+        storage.append_row(config.PRODUCT_NAMES_CSV, [product.name])
+        self.save_economics()
+
+    def update(self, product_name, **changes):
+        product = self.products[product_name]
+        for key, value in changes.items():
+            setattr(product, key, value)
+
+        # Renames keep the product's place in the catalog
+        if product.name != product_name:
+            self.products = {
+                (product.name if key == product_name else key): value
+                for key, value in self.products.items()
+            }
+            del self.product_economics[product_name]
+        self.product_economics[product.name] = ProductEconomics.of(product)
+        self.save()
+        return product
+
+    def delete(self, name):
+        del self.products[name]
+        del self.product_economics[name]
+        self.save()
+
+    def save(self):
+        storage.write_rows(
+            config.PRODUCT_DATA_CSV,
+            [product.to_row() for product in self],
+            headers=config.PRODUCT_DATA_HEADERS
+        )
+        storage.write_rows(
+            config.PRODUCT_NAMES_CSV,
+            [[name] for name in self.names()],
+            headers=["PRODUCT"]
+        )
+        self.save_economics()
+
+    def save_economics(self):
+        if not self.economics_file:
+            return
+        saved = {
+            "state": product_data_state(self.store or storage.get_storage()),
+            "products": [
+                {"product": asdict(product), "economics": asdict(self.product_economics[product.name])}
+                for product in self
+            ]
+        }
+        temp_file = self.economics_file + ".tmp"
+        with open(temp_file, mode="w") as file:
+            json.dump(saved, file, indent=2)
+        os.replace(temp_file, self.economics_file)
+
+def load_product_catalog(store=None, economics_file=config.PRODUCT_ECONOMICS_CACHE):
+    if store is None:
+        store = storage.get_storage()
+
+    # While the product data is unchanged since it was saved (edits outside the menus
+    # included), the catalog comes straight from economics_file: no product data read,
+    # no MATERIALS parsing and no economics to recompute
+    saved = load_economics(economics_file) if economics_file else {}
+    if saved.get("state") == product_data_state(store):
+        return ProductCatalog(
+            (Product(**entry["product"]) for entry in saved["products"]),
+            economics_file,
+            {entry["product"]["name"]: ProductEconomics(**entry["economics"]) for entry in saved["products"]},
+            store
+        )
+
+    product_data = store.load_list(config.PRODUCT_DATA_CSV, config.PRODUCT_DATA_HEADERS)
+    product_catalog = ProductCatalog(
+        (Product.from_row(row) for row in product_data[1:] if row),
+        economics_file,
+        store=store
+    )
+    product_catalog.save_economics()
+    return product_catalog
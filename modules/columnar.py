@@ -0,0 +1,129 @@
+# Standard Library Imports
+import json
+import os
+from datetime import datetime, timezone
+from itertools import islice
+
+# Third-Party Library Imports
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Local Application Imports
+import modules.catalog as catalog
+import modules.config as config
+import modules.excel_report as excel_report
+import modules.profiling as profiling
+import modules.records as records
+import modules.storage as storage
+
+FILE_EXTENSIONS = {"parquet": "parquet", "arrow": "arrow"}
+
+# Rows per record batch; the log tables are written batch by batch, never held whole
+BATCH_ROWS = 65536
+
+INT = pa.int64()
+FLOAT = pa.float64()
+TEXT = pa.string()
+
+# Column types for each table, in header order
+DAILY_SUMMARY_TYPES = [INT, FLOAT, FLOAT, FLOAT, INT, INT, INT, INT, TEXT, TEXT]
+DISTRIBUTOR_SALES_TYPES = [INT, TEXT, INT, FLOAT, FLOAT, FLOAT, FLOAT, TEXT]
+CUSTOMER_SUMMARY_TYPES = [TEXT, FLOAT, INT, INT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, TEXT, TEXT, TEXT]
+PRODUCT_SUMMARY_TYPES = [TEXT, FLOAT, INT, INT, TEXT, FLOAT, FLOAT, FLOAT, FLOAT, INT, FLOAT]
+SALES_TYPES = [INT, TEXT, INT, FLOAT, FLOAT, FLOAT, TEXT, TEXT, TEXT, TEXT]
+
+### Tables ###
+
+def table_schema(headers, types):
+    # Column names match the workbook headers, so notebooks can switch from read_excel unchanged
+    return pa.schema([pa.field(header, column_type) for header, column_type in zip(headers, types)])
+
+def write_table(file_name, table_format, schema, rows):
+    # Written to a temporary file and renamed, so readers never see a partial table
+    temp_file = file_name + ".tmp"
+    if table_format == "parquet":
+        writer = pq.ParquetWriter(temp_file, schema)
+    else:
+        writer = pa.ipc.new_file(temp_file, schema)
+
+    row_count = 0
+    rows = iter(rows)
+    with writer:
+        while True:
+            batch_rows = list(islice(rows, BATCH_ROWS))
+            if not batch_rows:
+                break
+            columns = zip(*batch_rows)
+            writer.write_batch(pa.record_batch(
+                [pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+                schema=schema
+            ))
+            row_count += len(batch_rows)
+    os.replace(temp_file, file_name)
+    return row_count
+
+### Export ###
+
+def export_tables(output_dir=None, table_format="parquet", report=None, incremental=True, day_window=None):
+    # Writes the raw logs and every summary table from the workbook as typed columnar files,
+    # plus a manifest.json describing them. report is reused if the workbook export built one.
+    if output_dir is None:
+        output_dir = config.COLUMNAR_EXPORT_DIRECTORY
+    os.makedirs(output_dir, exist_ok=True)
+
+    store = storage.get_storage()
+    with profiling.stage("load_products"):
+        products = catalog.load_product_catalog(store)
+    if report is None:
+        with profiling.stage("aggregate"):
+            report = store.build_report_data(incremental=incremental, day_window=day_window)
+
+    tables = [
+        ("daily_summary", config.DAILY_SUMMARY_HEADERS, DAILY_SUMMARY_TYPES,
+         lambda: excel_report.daily_summary_rows(report)),
+        ("distributor_sales", config.RAW_DISTRIBUTOR_DATA_REPORT_HEADERS, DISTRIBUTOR_SALES_TYPES,
+         lambda: excel_report.distributor_data_rows(records.iter_distributor_sales(store, day_window))),
+        ("customer_summary", config.CUSTOMER_SUMMARY_REPORT_HEADERS, CUSTOMER_SUMMARY_TYPES,
+         lambda: excel_report.customer_summary_rows(report)),
+        ("product_summary", config.PRODUCT_SUMMARY_REPORT_HEADERS, PRODUCT_SUMMARY_TYPES,
+         lambda: excel_report.product_summary_rows(products, report)),
+        ("sales", config.RAW_DATA_REPORT_HEADERS, SALES_TYPES,
+         lambda: excel_report.raw_data_rows(records.iter_sales(store, day_window))),
+    ]
+
+    manifest_tables = {}
+    for name, headers, types, table_rows in tables:
+        file_name = f"{name}.{FILE_EXTENSIONS[table_format]}"
+        schema = table_schema(headers, types)
+        with profiling.stage(f"write_table {name}"):
+            row_count = write_table(os.path.join(output_dir, file_name), table_format, schema, table_rows())
+        manifest_tables[name] = {
+            "file": file_name,
+            "rows": row_count,
+            "columns": [{"name": field.name, "type": str(field.type)} for field in schema]
+        }
+
+    manifest_file = os.path.join(output_dir, "manifest.json")
+    with open(manifest_file, mode="w") as file:
+        json.dump({
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "format": table_format,
+            "day_window": list(day_window) if day_window is not None else None,
+            "tables": manifest_tables
+        }, file, indent=2)
+    print(f"{output_dir} tables exported successfully.")
+    return report
+
+### Reading ###
+
+def load_table(name, output_dir=None):
+    # Reads one exported table back as a DataFrame, using the manifest to find its file
+    if output_dir is None:
+        output_dir = config.COLUMNAR_EXPORT_DIRECTORY
+    with open(os.path.join(output_dir, "manifest.json"), mode="r") as file:
+        manifest = json.load(file)
+    file_name = os.path.join(output_dir, manifest["tables"][name]["file"])
+    if manifest["format"] == "parquet":
+        return pq.read_table(file_name).to_pandas()
+    with pa.memory_map(file_name) as source:
+        return pa.ipc.open_file(source).read_all().to_pandas()
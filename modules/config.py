@@ -6,17 +6,118 @@ PRODUCT_DATA_CSV = "csv/product_data.csv"
 CUSTOMER_DATA_CSV = "csv/customer_data.csv"
 PRODUCT_NAMES_CSV = "csv/product_names.csv"
 DISTRIBUTOR_NAMES_CSV = "csv/distributor_names.csv"
+CUSTOMER_JOURNAL_CSV = "csv/customer_journal.csv"
+
+# Storage backend ("csv", "partitioned" or "sqlite"); a new SQLite database or partition
+# directory imports the CSV files above once
+
+STORAGE_BACKEND = "csv"
+SQLITE_DATABASE = "csv/business_data.db"
+
+# Partitioned backend: the sales logs are split into one CSV per PARTITION_DAYS days, listed in
+# a manifest, so reports over a day window only read the partitions they need
+
+PARTITION_DIRECTORY = "csv/partitions"
+PARTITION_DAYS = 7
+
+# Export checkpoint (summary aggregates and the log offsets they cover)
+
+EXPORT_CHECKPOINT = "csv/export_checkpoint.json"
+
+# CSV appends: one handle per file stays open and rows are written out by CSV_FLUSH_POLICY,
+# "row" (every append), "count" (every CSV_FLUSH_ROWS rows) or "timer" (CSV_FLUSH_SECONDS after
+# the first unwritten row); CSV_FSYNC also forces each flush to disk. Everything is written on exit.
+
+CSV_FLUSH_POLICY = "row"
+CSV_FLUSH_ROWS = 100
+CSV_FLUSH_SECONDS = 5.0
+CSV_FSYNC = False
+
+# Product economics (cost per unit, margin, profit per batch and hour), updated when a product changes
+
+PRODUCT_ECONOMICS_CACHE = "csv/product_economics.json"
+
+# Customer Summary percentiles: each customer's sale sizes and rates are kept in a quantile sketch
+# (answers within QUANTILE_SKETCH_ACCURACY, at most QUANTILE_SKETCH_MAX_BUCKETS buckets per sketch)
+
+QUANTILE_SKETCH_ACCURACY = 0.01
+QUANTILE_SKETCH_MAX_BUCKETS = 1024
+
+# Export cache (what each sheet and figure was last built from, so unchanged ones are skipped)
+
+EXPORT_CACHE = "csv/export_cache.json"
+
+# Full rebuilds of the summaries ("python" or "pandas"; pandas is much faster on large CSV logs)
+
+AGGREGATION_ENGINE = "python"
 
 # Excel File names
 
 BUSINESS_REPORT = "business_report.xlsx"
 
+# Export outputs: "xlsx" (the workbook), plus "parquet" or "arrow" for typed tables (needs pyarrow)
+EXPORT_FORMATS = ["xlsx"]
+COLUMNAR_EXPORT_DIRECTORY = "report_tables"
+
+# Stream rows to disk with a write-only workbook (flat memory on large logs)
+STREAMING_EXPORT = False
+
+# Write the Distributor and Raw Data sheets in worker processes while the summaries are built
+# (always uses the write-only workbook)
+PARALLEL_EXPORT = False
+
 # Matplotlib File names
 
 SALES_TOTALS_PER_DAY = "figures/daily_sales_totals.png"
 UNITS_SOLD_PER_DAY = "figures/daily_units_sold.png"
 DEALS_PER_DAY = "figures/daily_deals.png"
 
+# Figures (one chart per entry, rendered in parallel)
+
+DAILY_FIGURES = [
+    {
+        "column": "TOTAL SALES",
+        "title": "Daily Sales Totals",
+        "y_label": "Sales ($)",
+        "file": SALES_TOTALS_PER_DAY,
+        "color": "tab:blue"
+    },
+    {
+        "column": "TOTAL UNITS",
+        "title": "Units Sold Per Day",
+        "y_label": "Units",
+        "file": UNITS_SOLD_PER_DAY,
+        "color": "tab:green"
+    },
+    {
+        "column": "DEALS",
+        "title": "Number of Deals Per Day",
+        "y_label": "Number of Deals",
+        "file": DEALS_PER_DAY,
+        "color": "tab:orange"
+    }
+]
+
+# Worker processes for rendering figures (None = one per CPU)
+FIGURE_WORKERS = None
+
+# Profiling
+
+# Stage timing for every run (same as main.py --profile): a summary table plus a JSON trace
+PROFILE_STAGES = False
+PROFILE_TRACE = "profile_trace.json"
+
+# Startup
+
+# Cold start budget in seconds, checked by `python -m modules.startup`
+STARTUP_TIME_BUDGET = 0.5
+
+# Budget for loading the data at launch (main.initialize), checked on a generated sample of
+# STARTUP_SAMPLE_SALES sales with each backend in STARTUP_BACKENDS
+INITIALIZE_TIME_BUDGET = 0.25
+STARTUP_SAMPLE_SALES = 50000
+STARTUP_BACKENDS = ["csv", "partitioned", "sqlite"]
+
 # Spreadsheet Personalization
 
 FONT_COLOR = "FFFFFF"
@@ -53,6 +154,10 @@ CUSTOMER_SUMMARY_REPORT_HEADERS = [
     "AVG SALE",
     "AVG UNITS",
     "AVG RATE",
+    "MEDIAN SALE",
+    "P90 SALE",
+    "MEDIAN RATE",
+    "P90 RATE",
     "RELATIONSHIP",
     "TIME OF DAY (DEALS)",
     "LOCATIONS (DEALS)"
@@ -103,6 +208,12 @@ CUSTOMER_DATA_HEADERS = [
     "RELATIONSHIP"
 ]
 
+CUSTOMER_JOURNAL_HEADERS = [
+    "CUSTOMER",
+    "FIELD",
+    "VALUE"
+]
+
 PRODUCT_DATA_HEADERS = [
     "PRODUCT",
     "MATERIALS",
@@ -0,0 +1,66 @@
+# Local Application Imports
+import modules.config as config
+import modules.storage as storage
+
+# Journal fields (one small entry per change instead of rewriting customer_data.csv)
+LOCATION = "LOCATION"
+RELATIONSHIP = "RELATIONSHIP"
+
+### Journal ###
+
+def record_location(customer_name, location):
+    storage.append_row(config.CUSTOMER_JOURNAL_CSV, [customer_name, LOCATION, location])
+
+def record_relationship(customer_name, relationship):
+    storage.append_row(config.CUSTOMER_JOURNAL_CSV, [customer_name, RELATIONSHIP, relationship])
+
+def apply_journal(customer_data, entries):
+    # Entries only add locations or overwrite the relationship, so replaying them is idempotent
+    for row in entries:
+        if len(row) < 3 or row[0] not in customer_data:
+            continue
+        customer_name, field, value = row[:3]
+        if field == LOCATION:
+            customer_data[customer_name]["LOCATIONS"].add(value)
+        elif field == RELATIONSHIP:
+            customer_data[customer_name]["RELATIONSHIP"] = value
+
+### Loading ###
+
+def load_customer_data():
+    customer_data = storage.load_dict(
+        file_name=config.CUSTOMER_DATA_CSV,
+        headers=config.CUSTOMER_DATA_HEADERS,
+        key_field="CUSTOMER"
+    )
+
+    # Convert locations string to set for in-memory use
+    for customer, data in customer_data.items():
+        loc_string = data.get("LOCATIONS", "")
+        data["LOCATIONS"] = set(loc_string.split("|")) if loc_string else set()
+
+    # Merge changes recorded since the last compaction
+    journal = storage.load_list(config.CUSTOMER_JOURNAL_CSV, config.CUSTOMER_JOURNAL_HEADERS)
+    apply_journal(customer_data, journal[1:])
+
+    return customer_data
+
+### Compaction ###
+
+def compact_customer_journal():
+    journal = storage.load_list(config.CUSTOMER_JOURNAL_CSV, config.CUSTOMER_JOURNAL_HEADERS)
+    if len(journal) <= 1:
+        return
+
+    customer_data = load_customer_data()
+    rows = []
+    for name, data in customer_data.items():
+        locations_str = "|".join(sorted(data.get("LOCATIONS", [])))
+        relationship = data.get("RELATIONSHIP", "")
+        rows.append([name, data["REGION"], locations_str, relationship])
+
+    # Customer data is saved before the journal is cleared, so an interruption
+    # in between only replays entries that are already applied
+    storage.write_rows(config.CUSTOMER_DATA_CSV, rows, headers=config.CUSTOMER_DATA_HEADERS)
+    storage.write_rows(config.CUSTOMER_JOURNAL_CSV, [], headers=config.CUSTOMER_JOURNAL_HEADERS)
+    print(f"{config.CUSTOMER_DATA_CSV} compacted.")
@@ -1,15 +1,8 @@
 # Standard Library Imports
 import os
 import csv
-from collections import Counter, defaultdict
-from operator import itemgetter
-
-# Third-Party Library Imports
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side, numbers
-from openpyxl.utils import get_column_letter
-import matplotlib.pyplot as plt
-import pandas as pd
+import atexit
+import threading
 
 # Local Application Imports
 import modules.config as config
@@ -30,6 +23,7 @@ def format_products_summary(parsed_products):
 
 def load_or_create_dict_csv(file_name, headers, key_field):
     data = {}
+    flush_appends(file_name)
 
     if os.path.exists(file_name):
         with open(file_name, mode="r", newline="") as file:
@@ -48,6 +42,7 @@ def load_or_create_dict_csv(file_name, headers, key_field):
         return {}
 
 def load_or_create_list_csv(file_name, headers):
+    flush_appends(file_name)
     if os.path.exists(file_name):
         with open(file_name, mode="r", newline="") as file:
             reader = csv.reader(file)
@@ -62,6 +57,7 @@ def load_or_create_list_csv(file_name, headers):
         return []
     
 def load_or_create_set_csv(file_name, headers):
+    flush_appends(file_name)
     if os.path.exists(file_name):
         with open(file_name, mode="r", newline="") as file:
             reader = csv.reader(file)
@@ -76,607 +72,141 @@ def load_or_create_set_csv(file_name, headers):
             print(f"{file_name} created.")
         return set()
     
+def iter_csv_rows(file_name):
+    # Yields data rows one at a time (header skipped); a missing file yields nothing
+    flush_appends(file_name)
+    if not os.path.exists(file_name):
+        return
+    with open(file_name, mode="r", newline="") as file:
+        reader = csv.reader(file)
+        next(reader, None)
+        for row in reader:
+            if row:
+                yield row
+
+def create_csv_if_missing(file_name, headers):
+    flush_appends(file_name)
+    if os.path.exists(file_name):
+        return
+    with open(file_name, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(headers)
+    print(f"{file_name} created.")
+
 def write_csv(file_name, rows, headers=None):
+    # Pending appends are written and the append handle closed before the file is replaced
+    close_appends(file_name)
     with open(file_name, mode="w", newline="") as file:
         writer = csv.writer(file)
         if headers:
             writer.writerow(headers)
         writer.writerows(rows)
-    
-def append_csv(file_name, data):
-    with open(file_name, mode="a", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow(data)
-
-### Excel ###
-
-def build_daily_summary_sheet(ws, sales_data, distributor_data):
-    # Setup headers
-    ws.append(config.DAILY_SUMMARY_HEADERS)
-
-    # Setup dictionary for incrementing values
-    daily_summary_temp = defaultdict(lambda: {
-        "my_sales": 0.0,
-        "distributor_sales": 0.0,
-        "my_units_sold": 0,
-        "distributor_units_sold": 0,
-        "real_rate_total": 0.0,
-        "deals": 0,
-        "products": Counter(),
-        "customers": set(),
-        "customer_data": defaultdict(lambda: {"sales": 0.0, "units": 0})
-    })
-
-    # Build individual sales data
-    for row in sales_data[1:]:
-        current_day = int(row[0])
-        customer_name = row[1]
-        units_sold = int(row[2])
-        total_sales = float(row[3])
-        products_string = row[6]
-        
-        # Sum up sales data and customer names
-        day_summary = daily_summary_temp[current_day]
-        day_summary["my_units_sold"] += units_sold
-        day_summary["deals"] += 1
-        day_summary["customers"].add(customer_name)
-        day_summary["my_sales"] += total_sales
-
-        # Parse and gather product information
-        parsed_products = parse_products_string(products_string)
-        parsed_products.sort(key=lambda x: x[1], reverse=True)
-
-        for name, units, _ in parsed_products:
-            day_summary["products"][name] += units
-
-        # Gather individual customer total sales and units sold
-        cust_data = day_summary["customer_data"][customer_name]
-        cust_data["sales"] += total_sales
-        cust_data["units"] += units_sold
-
-    for row in distributor_data[1:]:
-        current_day = int(row[0])
-        units_sold = int(row[2])
-        total_sales = float(row[3])
-        products_string = row[7]
-
-        day_summary = daily_summary_temp[current_day]
-        day_summary["distributor_units_sold"] += units_sold
-        day_summary["distributor_sales"] += total_sales
-
-        # Parse and gather product information
-        parsed_products = parse_products_string(products_string)
-        for name, units, _ in parsed_products:
-            day_summary["products"][name] += units
-
-    for day in sorted(daily_summary_temp):
-        data = daily_summary_temp[day]
-
-        # Sort customer list by sales amount
-        sorted_customers = sorted(
-            data["customer_data"].items(),
-            key=lambda item: item[1]["sales"],
-            reverse=True
-        )
-
-        # Format customer list
-        formatted_customers = [
-            f"{name} (${info['sales']:.0f} / {info['units']} units)"
-            for name, info in sorted_customers
-        ]
-        customer_summary = ", ".join(formatted_customers)
-
-        sorted_products = sorted(data["products"].items(), key=lambda item: item[1], reverse=True)
-        product_summary = ", ".join(f"{name} ({units})" for name, units in sorted_products)
-
-        # Totals
-        total_sales = data["my_sales"] + data["distributor_sales"]
-        total_units = data["my_units_sold"] + data["distributor_units_sold"]
-
-        ws.append([
-            day,
-            round(total_sales, 2),
-            round(data["my_sales"], 2),
-            round(data["distributor_sales"], 2),
-            total_units,
-            data["my_units_sold"],
-            data["distributor_units_sold"],
-            data["deals"],
-            product_summary,
-            customer_summary,
-        ])
-
-    # Set individual column widths
-    column_widths = [8, 16, 16, 16, 16, 16, 16, 10, 50, 150]
-    for i, width in enumerate(column_widths, start=1):
-        col_letter = get_column_letter(i)
-        ws.column_dimensions[col_letter].width = width
-    
-    # Style the header row
-    for cell in ws[1]:
-        cell.font = Font(color=config.FONT_COLOR, bold=True)
-        cell.alignment = Alignment(horizontal="center")
-        cell.fill = PatternFill(
-            start_color=config.CELL_COLOR,
-            end_color=config.CELL_COLOR,
-            fill_type="solid"
-        )
-        cell.border = Border(
-            left=Side(style="thin", color=config.FONT_COLOR),
-            right=Side(style="thin", color=config.FONT_COLOR),
-            top=Side(style="thin", color=config.FONT_COLOR),
-            bottom=Side(style="thin", color=config.FONT_COLOR),
-        )
-
-    # Style the data rows
-    for row in ws.iter_rows(min_row=2):
-        for i, cell in enumerate(row):
-            cell.font = Font(color=config.FONT_COLOR)
-            cell.alignment = Alignment(horizontal="center")
-            cell.fill = PatternFill(
-                start_color=config.CELL_COLOR,
-                end_color=config.CELL_COLOR,
-                fill_type="solid"
-            )
-            cell.border = Border(
-                left=Side(style="thin", color=config.FONT_COLOR),
-                right=Side(style="thin", color=config.FONT_COLOR),
-                top=Side(style="thin", color=config.FONT_COLOR),
-                bottom=Side(style="thin", color=config.FONT_COLOR),
-            )
-            if i in (1, 2, 3):
-                cell.number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
-
-def build_distributor_summary_sheet(ws, distributor_sales_data):
-    ws.append(config.RAW_DISTRIBUTOR_DATA_REPORT_HEADERS)
-
-    for row in distributor_sales_data[1:]:  # Skip header row
-        day = int(row[0])
-        distributor = row[1]
-        units_sold = int(row[2])
-        gross_sales = float(row[3])
-        net_sales = float(row[4])
-        real_rate = float(row[5])
-        ask_rate = float(row[6])
-        products_string = row[7]
-
-        parsed_products = parse_products_string(products_string)
-        parsed_products.sort(key=lambda x: x[1], reverse=True)
-        product_summary = ", ".join(f"{name} ({units})" for name, units, _ in parsed_products)
-
-        ws.append([
-            day,
-            distributor,
-            units_sold,
-            gross_sales,
-            net_sales,
-            real_rate,
-            ask_rate,
-            product_summary
-        ])
-
-    # Set individual column widths
-    column_widths = [8, 20, 14, 18, 18, 14, 12, 100]
-    for i, width in enumerate(column_widths, start=1):
-        col_letter = get_column_letter(i)
-        ws.column_dimensions[col_letter].width = width
-
-    # Style the header row
-    for cell in ws[1]:
-        cell.font = Font(color=config.FONT_COLOR, bold=True)
-        cell.alignment = Alignment(horizontal="center")
-        cell.fill = PatternFill(
-            start_color=config.CELL_COLOR,
-            end_color=config.CELL_COLOR,
-            fill_type="solid"
-        )
-        cell.border = Border(
-            left=Side(style="thin", color=config.FONT_COLOR),
-            right=Side(style="thin", color=config.FONT_COLOR),
-            top=Side(style="thin", color=config.FONT_COLOR),
-            bottom=Side(style="thin", color=config.FONT_COLOR),
-        )
-
-    # Style the data rows
-    for row in ws.iter_rows(min_row=2):
-        for i, cell in enumerate(row):
-            cell.font = Font(color=config.FONT_COLOR)
-            cell.fill = PatternFill(
-                start_color=config.CELL_COLOR,
-                end_color=config.CELL_COLOR,
-                fill_type="solid"
-            )
-            cell.border = Border(
-                left=Side(style="thin", color=config.FONT_COLOR),
-                right=Side(style="thin", color=config.FONT_COLOR),
-                top=Side(style="thin", color=config.FONT_COLOR),
-                bottom=Side(style="thin", color=config.FONT_COLOR),
-            )
-            if i in (0, 2, 6, 7):
-                cell.alignment = Alignment(horizontal="center")
-            elif i in (3, 4, 5, 6):
-                cell.alignment = Alignment(horizontal="center")
-                cell.number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
-
-def build_customer_summary_sheet(ws, sales_data):
-    ws.append(config.CUSTOMER_SUMMARY_REPORT_HEADERS)
-
-    # Setup dictionary for incrementing values
-    customer_summary_temp = defaultdict(lambda: {
-        "total_sales": 0.0,
-        "units_total": 0,
-        "deals": 0,
-        "rates": [],
-        "units": [],
-        "relationship": "",
-        "times_of_day": Counter(),
-        "locations": Counter()
-    })
-
-    # Build individual sales data
-    for row in sales_data[1:]:
-        customer_name = row[1]
-        units_sold = int(row[2])
-        total_sales = float(row[3])
-        real_rate = float(row[4])
-        location = row[7]
-        time_of_day = row[8]
-        relationship = row[9]
-
-        # Sum up sales data and customer names
-        customer = customer_summary_temp[customer_name]
-        customer["total_sales"] += total_sales
-        customer["units_total"] += units_sold
-        customer["deals"] += 1
-        customer["rates"].append(real_rate)
-        customer["units"].append(units_sold)
-        customer["relationship"] = relationship
-        customer["times_of_day"][time_of_day] += 1
-        customer["locations"][location] += 1
-
-    for name in sorted(customer_summary_temp):
-        data = customer_summary_temp[name]
-        avg_sale = data["total_sales"] / data["deals"]
-        avg_units = data["units_total"] / data["deals"]
-        avg_rate = sum(data["rates"]) / len(data["rates"])
-
-        # Sort time of day and location counts
-        sorted_times = sorted(data["times_of_day"].items(), key=itemgetter(1), reverse=True)
-        sorted_locs = sorted(data["locations"].items(), key=itemgetter(1), reverse=True)
-        formatted_times = ", ".join([f"{time} ({count})" for time, count in sorted_times])
-        formatted_locs = ", ".join([f"{loc} ({count})" for loc, count in sorted_locs])
 
-        ws.append([
-            name,
-            round(data["total_sales"], 2),
-            data["units_total"],
-            data["deals"],
-            round(avg_sale, 2),
-            round(avg_units, 2),
-            round(avg_rate, 2),
-            data["relationship"],
-            formatted_times,
-            formatted_locs
-        ])
-
-    # Set individual column widths
-    column_widths = [20, 14, 14, 12, 14, 14, 14, 16, 60, 100]
-    for i, width in enumerate(column_widths, start=1):
-        col_letter = get_column_letter(i)
-        ws.column_dimensions[col_letter].width = width
-
-    # Style the header row
-    for cell in ws[1]:
-        cell.font = Font(color=config.FONT_COLOR, bold=True)
-        cell.alignment = Alignment(horizontal="center")
-        cell.fill = PatternFill(
-            start_color=config.CELL_COLOR,
-            end_color=config.CELL_COLOR,
-            fill_type="solid"
-        )
-        cell.border = Border(
-            left=Side(style="thin", color=config.FONT_COLOR),
-            right=Side(style="thin", color=config.FONT_COLOR),
-            top=Side(style="thin", color=config.FONT_COLOR),
-            bottom=Side(style="thin", color=config.FONT_COLOR),
-        )
-
-    # Style the data rows
-    for row in ws.iter_rows(min_row=2):
-        for i, cell in enumerate(row):
-            cell.font = Font(color=config.FONT_COLOR)
-            cell.alignment = Alignment(horizontal="center")
-            cell.fill = PatternFill(
-                start_color=config.CELL_COLOR,
-                end_color=config.CELL_COLOR,
-                fill_type="solid"
-            )
-            cell.border = Border(
-                left=Side(style="thin", color=config.FONT_COLOR),
-                right=Side(style="thin", color=config.FONT_COLOR),
-                top=Side(style="thin", color=config.FONT_COLOR),
-                bottom=Side(style="thin", color=config.FONT_COLOR),
-            )
-            if i in (1, 4):
-                cell.number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
-            elif i in (5, 6):
-                cell.number_format = '0.00'
-
-def build_product_summary_sheet(ws, product_data, sales_data):
-    ws.append(config.PRODUCT_SUMMARY_REPORT_HEADERS)
-
-    product_sales = {}
-
-    for row in sales_data[1:]:
-        total_sale = float(row[3])
-        products_string = row[6]
-        parsed = parse_products_string(products_string)
-        total_units_in_sale = sum(units for _, units, _ in parsed)
-
-        for name, units, _ in parsed:
-            if name not in product_sales:
-                product_sales[name] = {"sales": 0.0, "units": 0}
-            portion = units / total_units_in_sale if total_units_in_sale else 0
-            product_sales[name]["sales"] += total_sale * portion
-            product_sales[name]["units"] += units
-
-    # Build individual product data
-    for row in product_data[1:]:
-        product_name = row[0]
-        materials = row[1]
-        timeframe = int(row[2])
-        yield_amount = int(row[3])
-        sell_price = int(row[4])
-
-        # Parse materials information
-        parsed_materials = [
-            {
-                "name": name,
-                "amount": int(amount),
-                "price": int(price)
-            }
-            for entry in materials.split("|")
-            for name, amount, price in [entry.split(":")]
-        ]
-
-        # Calculate profit margin per unit
-        materials_cost = sum(m["amount"] * m["price"] for m in parsed_materials)
-        materials_cost_per_unit = materials_cost / yield_amount
-        profit_per_unit = sell_price - materials_cost_per_unit
-
-        # Calculate profit per batch and per hour
-        profit_per_batch = profit_per_unit * yield_amount
-        profit_per_hour = profit_per_batch / timeframe if timeframe > 0 else 0
-
-        # Format timeframe
-        timeframe_str = f"{timeframe} hour" if timeframe == 1 else f"{timeframe} hours"
-
-        # Calculate sales figures
-        total_sales = product_sales.get(product_name, {}).get("sales", 0)
-        total_units = product_sales.get(product_name, {}).get("units", 0)
-        rate = round(total_sales / total_units, 2) if total_units else 0
-
-        ws.append([
-            product_name,
-            round(materials_cost_per_unit, 2),
-            sell_price,
-            yield_amount,
-            timeframe_str,
-            round(profit_per_unit, 2),
-            round(profit_per_batch, 2),
-            round(profit_per_hour, 2),
-            round(total_sales, 2),
-            total_units,
-            round(rate, 2)
-        ])
-
-    # Set individual column widths
-    column_widths = [20, 20, 14, 8, 22, 12, 22, 22, 18, 14, 14]
-    for i, width in enumerate(column_widths, start=1):
-        col_letter = get_column_letter(i)
-        ws.column_dimensions[col_letter].width = width
-
-    # Style the header row
-    for cell in ws[1]:
-        cell.font = Font(color=config.FONT_COLOR, bold=True)
-        cell.alignment = Alignment(horizontal="center")
-        cell.fill = PatternFill(
-            start_color=config.CELL_COLOR,
-            end_color=config.CELL_COLOR,
-            fill_type="solid"
-        )
-        cell.border = Border(
-            left=Side(style="thin", color=config.FONT_COLOR),
-            right=Side(style="thin", color=config.FONT_COLOR),
-            top=Side(style="thin", color=config.FONT_COLOR),
-            bottom=Side(style="thin", color=config.FONT_COLOR),
-        )
-
-    # Style the data rows
-    for row in ws.iter_rows(min_row=2):
-        for i, cell in enumerate(row):
-            cell.font = Font(color=config.FONT_COLOR)
-            cell.fill = PatternFill(
-                start_color=config.CELL_COLOR,
-                end_color=config.CELL_COLOR,
-                fill_type="solid"
-            )
-            cell.border = Border(
-                left=Side(style="thin", color=config.FONT_COLOR),
-                right=Side(style="thin", color=config.FONT_COLOR),
-                top=Side(style="thin", color=config.FONT_COLOR),
-                bottom=Side(style="thin", color=config.FONT_COLOR),
-            )
-            if i in (1, 2, 5, 6, 7, 8, 10):
-                cell.alignment = Alignment(horizontal="center")
-                cell.number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
+def append_csv(file_name, data):
+    get_appender().append_rows(file_name, [data])
+
+def append_rows_csv(file_name, rows):
+    get_appender().append_rows(file_name, rows)
+
+### Buffered Appends ###
+
+class CsvAppender:
+    # Keeps one append handle per file open for the session and buffers rows until the flush
+    # policy writes them: "row" (every append), "count" (every flush_rows rows) or "timer"
+    # (flush_seconds after the first pending row). Rows are only handed to the file at a flush,
+    # whole, so readers (which flush first) never see half a row.
+    def __init__(self, policy="row", flush_rows=100, flush_seconds=5.0, fsync=False):
+        self.policy = policy
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.fsync = fsync
+        self.handles = {}
+        self.pending = {}
+        self.pending_count = 0
+        self.timer = None
+        # The timer flushes from its own thread
+        self.lock = threading.RLock()
+
+    def append_rows(self, file_name, rows):
+        with self.lock:
+            rows = list(rows)
+            if not rows:
+                return
+            self.pending.setdefault(file_name, []).extend(rows)
+            self.pending_count += len(rows)
+            if self.policy == "count":
+                if self.pending_count >= self.flush_rows:
+                    self.flush()
+            elif self.policy == "timer":
+                if self.timer is None:
+                    self.timer = threading.Timer(self.flush_seconds, self.flush)
+                    self.timer.daemon = True
+                    self.timer.start()
             else:
-                cell.alignment = Alignment(horizontal="center")
-
-
-def build_raw_data_sheet(ws, sales_data):
-    ws.append(config.RAW_DATA_REPORT_HEADERS)
-
-    # Build individual sales data
-    for row in sales_data[1:]:
-        current_day = row[0]
-        customer_name = row[1]
-        units_sold = row[2]
-        total_sales = row[3]
-        real_rate = row[4]
-        ask_rate = row[5]
-        products = row[6]
-        location = row[7]
-        time_of_day = row[8]
-        relationship_level = row[9]
-
-        parsed_products = parse_products_string(products)
-        parsed_products.sort(key=lambda x: x[1], reverse=True)
-        product_summary = ", ".join(f"{name} ({units})" for name, units, _ in parsed_products)
-
-        ws.append([
-            int(current_day),
-            customer_name,
-            int(units_sold),
-            float(total_sales),
-            float(real_rate),
-            float(ask_rate),
-            product_summary,
-            location,
-            time_of_day,
-            relationship_level
-        ])
-
-    # Set individual column widths
-    column_widths = [8, 20, 14, 18, 14, 12, 50, 24, 16, 20]
-    for i, width in enumerate(column_widths, start=1):
-        col_letter = get_column_letter(i)
-        ws.column_dimensions[col_letter].width = width
-
-    # Style the header row
-    for cell in ws[1]:
-        cell.font = Font(color=config.FONT_COLOR, bold=True)
-        cell.alignment = Alignment(horizontal="center")
-        cell.fill = PatternFill(
-            start_color=config.CELL_COLOR,
-            end_color=config.CELL_COLOR,
-            fill_type="solid"
+                self.flush(file_name)
+
+    def handle(self, file_name):
+        if file_name not in self.handles:
+            file = open(file_name, mode="a", newline="")
+            self.handles[file_name] = (file, csv.writer(file))
+        return self.handles[file_name]
+
+    def flush(self, file_name=None):
+        # Writes pending rows for file_name, or for every file
+        with self.lock:
+            file_names = list(self.pending) if file_name is None else [file_name]
+            for name in file_names:
+                rows = self.pending.pop(name, None)
+                if not rows:
+                    continue
+                file, writer = self.handle(name)
+                writer.writerows(rows)
+                file.flush()
+                if self.fsync:
+                    os.fsync(file.fileno())
+                self.pending_count -= len(rows)
+            if not self.pending and self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+    def close(self, file_name=None):
+        with self.lock:
+            self.flush(file_name)
+            file_names = list(self.handles) if file_name is None else [file_name]
+            for name in file_names:
+                if name in self.handles:
+                    self.handles.pop(name)[0].close()
+
+    def reset_after_fork(self):
+        # Worker processes start with nothing pending (the parent flushed before forking)
+        # and open their own handles if they append
+        self.handles = {}
+        self.pending = {}
+        self.pending_count = 0
+        self.timer = None
+        self.lock = threading.RLock()
+
+appender = None
+
+def get_appender():
+    global appender
+    if appender is None:
+        appender = CsvAppender(
+            config.CSV_FLUSH_POLICY,
+            config.CSV_FLUSH_ROWS,
+            config.CSV_FLUSH_SECONDS,
+            config.CSV_FSYNC
         )
-        cell.border = Border(
-            left=Side(style="thin", color=config.FONT_COLOR),
-            right=Side(style="thin", color=config.FONT_COLOR),
-            top=Side(style="thin", color=config.FONT_COLOR),
-            bottom=Side(style="thin", color=config.FONT_COLOR),
-        )
-
-    # Style the data rows
-    for row in ws.iter_rows(min_row=2):
-        for i, cell in enumerate(row):
-            cell.font = Font(color=config.FONT_COLOR)
-            cell.fill = PatternFill(
-                start_color=config.CELL_COLOR,
-                end_color=config.CELL_COLOR,
-                fill_type="solid"
-            )
-            cell.border = Border(
-                left=Side(style="thin", color=config.FONT_COLOR),
-                right=Side(style="thin", color=config.FONT_COLOR),
-                top=Side(style="thin", color=config.FONT_COLOR),
-                bottom=Side(style="thin", color=config.FONT_COLOR),
-            )
-            if i in (0, 2, 6, 7, 8, 9):
-                cell.alignment = Alignment(horizontal="center")
-            elif i in (3, 4, 5):
-                cell.alignment = Alignment(horizontal="center")
-                cell.number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
-
-def export_spreadsheet():
-    wb = Workbook()
-    ws = wb.active
-    sales_data = load_or_create_list_csv(config.SALES_DATA_CSV, config.RAW_DATA_REPORT_HEADERS)
-    product_data = load_or_create_list_csv(config.PRODUCT_DATA_CSV, config.PRODUCT_DATA_HEADERS)
-    distributor_data = load_or_create_list_csv(
-        config.DISTRIBUTOR_SALES_DATA_CSV,
-        config.RAW_DISTRIBUTOR_DATA_REPORT_HEADERS
-    )
-
-    ws.title = config.DAILY_SUMMARY_REPORT_NAME
-    build_daily_summary_sheet(ws, sales_data, distributor_data)
-
-    distributor_data_ws = wb.create_sheet(title=config.DISTRIBUTOR_SUMMARY_REPORT_NAME)
-    build_distributor_summary_sheet(distributor_data_ws, distributor_data)
-
-    customer_data_ws = wb.create_sheet(title=config.CUSTOMER_SUMMARY_REPORT_NAME)
-    build_customer_summary_sheet(customer_data_ws, sales_data)
-
-    product_data_ws = wb.create_sheet(title=config.PRODUCT_SUMMARY_REPORT_NAME)
-    build_product_summary_sheet(product_data_ws, product_data, sales_data)
-
-    raw_data_ws = wb.create_sheet(title=config.RAW_DATA_REPORT_NAME)
-    build_raw_data_sheet(raw_data_ws, sales_data)
-
-    os.makedirs("csv", exist_ok=True)
-
-    # Save workbook
-    while True:
-        try:
-            wb.save(config.BUSINESS_REPORT)
-            print(f"{config.BUSINESS_REPORT} exported successfully.")
-            break
-        except PermissionError:
-            print(f"Unable to save {config.BUSINESS_REPORT}. Check to see if it is open in another program.")
-            while True:
-                choice = input("Try again? (y/n): ").strip().lower()
-                if choice == "y":
-                    print("Retrying...")
-                    break
-                elif choice == "n":
-                    print("Export canceled.")
-                    return
-                else:
-                    print("Please enter 'y' for yes or 'n' for no.")
-
-### Matplotlib ###
-
-def plot_column_over_days(df, column_name, title, y_label, output_filename, color="tab:blue"):
-    plt.figure(figsize=(10, 6))
-    plt.plot(df["DAY"], df[column_name], marker="o", linestyle="-", color=color)
-    plt.title(title)
-    plt.xlabel("Day")
-    plt.ylabel(y_label)
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(output_filename)
-    plt.close()
-    print(f"{output_filename} exported successfully.")
-
-def export_figures():
-    df = pd.read_excel(config.BUSINESS_REPORT, sheet_name=config.DAILY_SUMMARY_REPORT_NAME, engine="openpyxl")
-    os.makedirs("figures", exist_ok=True)
-
-    plot_column_over_days(
-        df,
-        column_name="TOTAL SALES",
-        title="Daily Sales Totals",
-        y_label="Sales ($)",
-        output_filename=config.SALES_TOTALS_PER_DAY,
-        color="tab:blue"
-    )
-
-    plot_column_over_days(
-        df,
-        column_name="TOTAL UNITS",
-        title="Units Sold Per Day",
-        y_label="Units",
-        output_filename=config.UNITS_SOLD_PER_DAY,
-        color="tab:green"
-    )
-
-    plot_column_over_days(
-        df,
-        column_name="DEALS",
-        title="Number of Deals Per Day",
-        y_label="Number of Deals",
-        output_filename=config.DEALS_PER_DAY,
-        color="tab:orange"
-    )
+        atexit.register(appender.close)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(before=appender.flush, after_in_child=appender.reset_after_fork)
+    return appender
+
+def flush_appends(file_name=None):
+    # Call before reading a file by path outside these helpers
+    if appender is not None:
+        appender.flush(file_name)
+
+def close_appends(file_name=None):
+    if appender is not None:
+        appender.close(file_name)
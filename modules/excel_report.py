@@ -0,0 +1,460 @@
+# Standard Library Imports
+import os
+import shutil
+import tempfile
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from operator import itemgetter
+
+# Third-Party Library Imports
+from openpyxl import Workbook
+
+# Local Application Imports
+import modules.catalog as catalog
+import modules.config as config
+import modules.profiling as profiling
+import modules.records as records
+import modules.styles as styles
+import modules.data_io as io
+import modules.storage as storage
+
+# Column layouts (widths and registered style names) for each sheet
+
+DAILY_SUMMARY_COLUMN_WIDTHS = [8, 16, 16, 16, 16, 16, 16, 10, 50, 150]
+DAILY_SUMMARY_COLUMN_STYLES = [
+    styles.DATA,
+    styles.CURRENCY,
+    styles.CURRENCY,
+    styles.CURRENCY,
+    styles.DATA,
+    styles.DATA,
+    styles.DATA,
+    styles.DATA,
+    styles.DATA,
+    styles.DATA
+]
+
+DISTRIBUTOR_SUMMARY_COLUMN_WIDTHS = [8, 20, 14, 18, 18, 14, 12, 100]
+DISTRIBUTOR_SUMMARY_COLUMN_STYLES = [
+    styles.DATA,
+    styles.DATA_LEFT,
+    styles.DATA,
+    styles.CURRENCY,
+    styles.CURRENCY,
+    styles.CURRENCY,
+    styles.DATA,
+    styles.DATA
+]
+
+CUSTOMER_SUMMARY_COLUMN_WIDTHS = [20, 14, 14, 12, 14, 14, 14, 14, 14, 14, 14, 16, 60, 100]
+CUSTOMER_SUMMARY_COLUMN_STYLES = [
+    styles.DATA,
+    styles.CURRENCY,
+    styles.DATA,
+    styles.DATA,
+    styles.CURRENCY,
+    styles.DECIMAL,
+    styles.DECIMAL,
+    styles.CURRENCY,
+    styles.CURRENCY,
+    styles.DECIMAL,
+    styles.DECIMAL,
+    styles.DATA,
+    styles.DATA,
+    styles.DATA
+]
+
+PRODUCT_SUMMARY_COLUMN_WIDTHS = [20, 20, 14, 8, 22, 12, 22, 22, 18, 14, 14]
+PRODUCT_SUMMARY_COLUMN_STYLES = [
+    styles.DATA,
+    styles.CURRENCY,
+    styles.CURRENCY,
+    styles.DATA,
+    styles.DATA,
+    styles.CURRENCY,
+    styles.CURRENCY,
+    styles.CURRENCY,
+    styles.CURRENCY,
+    styles.DATA,
+    styles.CURRENCY
+]
+
+RAW_DATA_COLUMN_WIDTHS = [8, 20, 14, 18, 14, 12, 50, 24, 16, 20]
+RAW_DATA_COLUMN_STYLES = [
+    styles.DATA,
+    styles.DATA_LEFT,
+    styles.DATA,
+    styles.CURRENCY,
+    styles.CURRENCY,
+    styles.CURRENCY,
+    styles.DATA,
+    styles.DATA,
+    styles.DATA,
+    styles.DATA
+]
+
+def daily_summary_rows(report):
+    daily_summary = report["daily"]
+    for day in sorted(daily_summary):
+        data = daily_summary[day]
+
+        # Sort customer list by sales amount
+        sorted_customers = sorted(
+            data["customer_data"].items(),
+            key=lambda item: item[1]["sales"],
+            reverse=True
+        )
+
+        # Format customer list
+        formatted_customers = [
+            f"{name} (${info['sales']:.0f} / {info['units']} units)"
+            for name, info in sorted_customers
+        ]
+        customer_summary = ", ".join(formatted_customers)
+
+        # Customer products first, so ties keep the same order however the logs were folded in
+        products = Counter(data["products"])
+        products.update(data["distributor_products"])
+        sorted_products = sorted(products.items(), key=lambda item: item[1], reverse=True)
+        product_summary = ", ".join(f"{name} ({units})" for name, units in sorted_products)
+
+        # Totals
+        total_sales = data["my_sales"] + data["distributor_sales"]
+        total_units = data["my_units_sold"] + data["distributor_units_sold"]
+
+        yield [
+            day,
+            round(total_sales, 2),
+            round(data["my_sales"], 2),
+            round(data["distributor_sales"], 2),
+            total_units,
+            data["my_units_sold"],
+            data["distributor_units_sold"],
+            data["deals"],
+            product_summary,
+            customer_summary,
+        ]
+
+def distributor_data_rows(distributor_sales):
+    for sale in distributor_sales:
+        parsed_products = sorted(sale.products, key=lambda x: x[1], reverse=True)
+
+        yield [
+            sale.day,
+            sale.distributor,
+            sale.units_sold,
+            sale.gross_sales,
+            sale.net_sales,
+            sale.real_rate,
+            sale.ask_rate,
+            io.format_products_summary(parsed_products)
+        ]
+
+def customer_summary_rows(report):
+    customer_summary = report["customers"]
+    for name in sorted(customer_summary):
+        data = customer_summary[name]
+        avg_sale = data["total_sales"] / data["deals"]
+        avg_units = data["units_total"] / data["deals"]
+        avg_rate = data["rate_total"] / data["deals"]
+        sale_sketch = data["sale_sketch"]
+        rate_sketch = data["rate_sketch"]
+
+        # Sort time of day and location counts
+        sorted_times = sorted(data["times_of_day"].items(), key=itemgetter(1), reverse=True)
+        sorted_locs = sorted(data["locations"].items(), key=itemgetter(1), reverse=True)
+        formatted_times = ", ".join([f"{time} ({count})" for time, count in sorted_times])
+        formatted_locs = ", ".join([f"{loc} ({count})" for loc, count in sorted_locs])
+
+        yield [
+            name,
+            round(data["total_sales"], 2),
+            data["units_total"],
+            data["deals"],
+            round(avg_sale, 2),
+            round(avg_units, 2),
+            round(avg_rate, 2),
+            round(sale_sketch.quantile(0.5), 2),
+            round(sale_sketch.quantile(0.9), 2),
+            round(rate_sketch.quantile(0.5), 2),
+            round(rate_sketch.quantile(0.9), 2),
+            data["relationship"],
+            formatted_times,
+            formatted_locs
+        ]
+
+def product_summary_rows(products, report):
+    product_sales = report["products"]
+
+    # Build individual product data (cost, margin and profits come from the catalog's economics)
+    for product in products:
+        product_name = product.name
+        timeframe = product.timeframe
+        economics = products.economics(product_name)
+
+        # Format timeframe
+        timeframe_str = f"{timeframe} hour" if timeframe == 1 else f"{timeframe} hours"
+
+        # Calculate sales figures
+        total_sales = product_sales.get(product_name, {}).get("sales", 0)
+        total_units = product_sales.get(product_name, {}).get("units", 0)
+        rate = round(total_sales / total_units, 2) if total_units else 0
+
+        yield [
+            product_name,
+            round(economics.materials_cost_per_unit, 2),
+            product.sell_price,
+            product.yield_amount,
+            timeframe_str,
+            round(economics.profit_per_unit, 2),
+            round(economics.profit_per_batch, 2),
+            round(economics.profit_per_hour, 2),
+            round(total_sales, 2),
+            total_units,
+            round(rate, 2)
+        ]
+
+def raw_data_rows(sales):
+    for sale in sales:
+        parsed_products = sorted(sale.products, key=lambda x: x[1], reverse=True)
+
+        yield [
+            sale.day,
+            sale.customer,
+            sale.units_sold,
+            sale.total_sales,
+            sale.real_rate,
+            sale.ask_rate,
+            io.format_products_summary(parsed_products),
+            sale.location,
+            sale.time_of_day,
+            sale.relationship
+        ]
+
+def write_table(ws, headers, rows, column_widths, column_styles):
+    styles.set_column_widths(ws, column_widths)
+    styles.append_header(ws, headers)
+    for row in rows:
+        styles.append_row(ws, row, column_styles)
+
+def build_daily_summary_sheet(ws, report):
+    write_table(
+        ws,
+        config.DAILY_SUMMARY_HEADERS,
+        daily_summary_rows(report),
+        DAILY_SUMMARY_COLUMN_WIDTHS,
+        DAILY_SUMMARY_COLUMN_STYLES
+    )
+
+def build_distributor_summary_sheet(ws, distributor_sales):
+    write_table(
+        ws,
+        config.RAW_DISTRIBUTOR_DATA_REPORT_HEADERS,
+        distributor_data_rows(distributor_sales),
+        DISTRIBUTOR_SUMMARY_COLUMN_WIDTHS,
+        DISTRIBUTOR_SUMMARY_COLUMN_STYLES
+    )
+
+def build_customer_summary_sheet(ws, report):
+    write_table(
+        ws,
+        config.CUSTOMER_SUMMARY_REPORT_HEADERS,
+        customer_summary_rows(report),
+        CUSTOMER_SUMMARY_COLUMN_WIDTHS,
+        CUSTOMER_SUMMARY_COLUMN_STYLES
+    )
+
+def build_product_summary_sheet(ws, products, report):
+    write_table(
+        ws,
+        config.PRODUCT_SUMMARY_REPORT_HEADERS,
+        product_summary_rows(products, report),
+        PRODUCT_SUMMARY_COLUMN_WIDTHS,
+        PRODUCT_SUMMARY_COLUMN_STYLES
+    )
+
+def build_raw_data_sheet(ws, sales):
+    write_table(
+        ws,
+        config.RAW_DATA_REPORT_HEADERS,
+        raw_data_rows(sales),
+        RAW_DATA_COLUMN_WIDTHS,
+        RAW_DATA_COLUMN_STYLES
+    )
+
+### Parallel Export ###
+
+# The sheets read straight from the sales logs, which dominate export time on large logs
+LOG_SHEETS = {
+    config.DISTRIBUTOR_SUMMARY_REPORT_NAME: (build_distributor_summary_sheet, records.iter_distributor_sales),
+    config.RAW_DATA_REPORT_NAME: (build_raw_data_sheet, records.iter_sales)
+}
+
+def write_log_sheet_part(title, day_window, part_file):
+    # Runs in a worker process: writes one log sheet to its own single-sheet workbook.
+    # Strings are written inline and style ids are fixed, so its worksheet XML can be
+    # copied into the parent's workbook unchanged.
+    wb = Workbook(write_only=True)
+    styles.register_report_styles(wb)
+    ws = wb.create_sheet(title=title)
+    styles.fix_style_ids(ws)
+    build_sheet, iter_records = LOG_SHEETS[title]
+    build_sheet(ws, iter_records(storage.open_storage(), day_window))
+    wb.save(part_file)
+    return part_file
+
+def sheet_part_name(wb, ws):
+    return f"xl/worksheets/sheet{wb.worksheets.index(ws) + 1}.xml"
+
+def assemble_workbook(skeleton_file, output_file, sheet_parts):
+    # Copies the saved workbook, swapping in worksheet XML for its placeholder sheets.
+    # sheet_parts maps a placeholder's part name to the (workbook file, part name) to copy.
+    with zipfile.ZipFile(skeleton_file) as skeleton, \
+            zipfile.ZipFile(output_file, mode="w", compression=zipfile.ZIP_DEFLATED) as output:
+        for item in skeleton.infolist():
+            source_part = sheet_parts.get(item.filename)
+            if source_part is None:
+                output.writestr(item, skeleton.read(item.filename))
+                continue
+            part_file, part_name = source_part
+            with zipfile.ZipFile(part_file) as part, \
+                    part.open(part_name) as source, \
+                    output.open(item.filename, mode="w") as target:
+                shutil.copyfileobj(source, target, 2**20)
+
+### Export ###
+
+def export_spreadsheet(
+    write_only=None,
+    incremental=True,
+    output_file=None,
+    interactive=True,
+    day_window=None,
+    parallel=None,
+    cache=None,
+    report=None
+):
+    # Returns the aggregated report (report, if it was given), or None if every summary sheet
+    # was reused from the cache
+    if output_file is None:
+        output_file = config.BUSINESS_REPORT
+    if write_only is None:
+        write_only = config.STREAMING_EXPORT
+    if parallel is None:
+        parallel = config.PARALLEL_EXPORT
+
+    with ExitStack() as stack:
+        # Sheets whose inputs are unchanged since the last export (see export_cache) are copied
+        # from the existing workbook instead of being rebuilt
+        reused_sheets = cache.current_sheets(output_file) if cache is not None else set()
+        if parallel or reused_sheets:
+            part_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="export_"))
+        if reused_sheets:
+            previous_file = os.path.join(part_dir, "previous.xlsx")
+            shutil.copyfile(output_file, previous_file)
+
+        # In parallel mode the log sheets are started first, so workers read the logs while
+        # this process aggregates and builds the summary sheets
+        log_sheet_jobs = {}
+        if parallel:
+            write_only = True
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=len(LOG_SHEETS)))
+            with profiling.stage("start_sheet_workers"):
+                for i, title in enumerate(LOG_SHEETS):
+                    if title in reused_sheets:
+                        continue
+                    part_file = os.path.join(part_dir, f"sheet_{i}.xlsx")
+                    log_sheet_jobs[title] = executor.submit(write_log_sheet_part, title, day_window, part_file)
+
+        # Write-only workbooks stream each row to disk instead of keeping cells in memory
+        wb = Workbook(write_only=write_only)
+        if not write_only:
+            wb.remove(wb.active)
+        styles.register_report_styles(wb)
+
+        store = storage.get_storage()
+        with profiling.stage("load_products"):
+            products = catalog.load_product_catalog(store)
+
+        # Aggregate the summaries (incrementally from a checkpoint, or in SQL, depending on the backend).
+        # The sales logs are never loaded whole: the aggregates and the row sheets each stream them.
+        # A day_window (first_day, last_day) limits every sheet to those days.
+        summary_sheets = {
+            config.DAILY_SUMMARY_REPORT_NAME,
+            config.CUSTOMER_SUMMARY_REPORT_NAME,
+            config.PRODUCT_SUMMARY_REPORT_NAME
+        }
+        if report is None and not summary_sheets <= reused_sheets:
+            with profiling.stage("aggregate"):
+                report = store.build_report_data(incremental=incremental, day_window=day_window)
+
+        sheets = [
+            ("build_daily_summary_sheet", config.DAILY_SUMMARY_REPORT_NAME,
+             lambda ws: build_daily_summary_sheet(ws, report)),
+            ("build_distributor_summary_sheet", config.DISTRIBUTOR_SUMMARY_REPORT_NAME,
+             lambda ws: build_distributor_summary_sheet(ws, records.iter_distributor_sales(store, day_window))),
+            ("build_customer_summary_sheet", config.CUSTOMER_SUMMARY_REPORT_NAME,
+             lambda ws: build_customer_summary_sheet(ws, report)),
+            ("build_product_summary_sheet", config.PRODUCT_SUMMARY_REPORT_NAME,
+             lambda ws: build_product_summary_sheet(ws, products, report)),
+            ("build_raw_data_sheet", config.RAW_DATA_REPORT_NAME,
+             lambda ws: build_raw_data_sheet(ws, records.iter_sales(store, day_window))),
+        ]
+        for stage, title, build_sheet in sheets:
+            ws = wb.create_sheet(title=title)
+            styles.fix_style_ids(ws)
+            # Reused sheets and sheets written by a worker are left empty here and filled in when saving
+            if title in reused_sheets or title in log_sheet_jobs:
+                continue
+            with profiling.stage(stage):
+                build_sheet(ws)
+
+        os.makedirs("csv", exist_ok=True)
+
+        sheet_parts = {}
+        for title in reused_sheets:
+            part_name = sheet_part_name(wb, wb[title])
+            sheet_parts[part_name] = (previous_file, part_name)
+        if log_sheet_jobs:
+            with profiling.stage("wait_sheet_workers"):
+                for title, job in log_sheet_jobs.items():
+                    sheet_parts[sheet_part_name(wb, wb[title])] = (job.result(), "xl/worksheets/sheet1.xml")
+        if sheet_parts:
+            # A write-only workbook can only be saved once, so it is saved aside and copied on each attempt
+            skeleton_file = os.path.join(part_dir, "skeleton.xlsx")
+            with profiling.stage("save_skeleton"):
+                wb.save(skeleton_file)
+
+        # Save workbook
+        while True:
+            try:
+                with profiling.stage("save_workbook"):
+                    if sheet_parts:
+                        assemble_workbook(skeleton_file, output_file, sheet_parts)
+                    else:
+                        wb.save(output_file)
+                print(f"{output_file} exported successfully.")
+                break
+            except PermissionError:
+                # Headless exports fail instead of prompting
+                if not interactive:
+                    raise
+                print(f"Unable to save {output_file}. Check to see if it is open in another program.")
+                while True:
+                    choice = input("Try again? (y/n): ").strip().lower()
+                    if choice == "y":
+                        print("Retrying...")
+                        break
+                    elif choice == "n":
+                        print("Export canceled.")
+                        return report
+                    else:
+                        print("Please enter 'y' for yes or 'n' for no.")
+
+        if cache is not None:
+            cache.record_workbook(output_file)
+            cache.save()
+
+    return report
@@ -0,0 +1,116 @@
+# Standard Library Imports
+import hashlib
+import json
+import os
+
+# Local Application Imports
+import modules.config as config
+import modules.data_io as data_io
+
+# Bump when a code change alters the workbook or figures, so older entries stop matching
+CACHE_VERSION = 1
+
+# The data sets each output is built from
+INPUT_FILES = {
+    "sales": config.SALES_DATA_CSV,
+    "distributor_sales": config.DISTRIBUTOR_SALES_DATA_CSV,
+    "products": config.PRODUCT_DATA_CSV
+}
+
+# Sheets in workbook order, with their inputs and headers
+SHEETS = {
+    config.DAILY_SUMMARY_REPORT_NAME: (["sales", "distributor_sales"], config.DAILY_SUMMARY_HEADERS),
+    config.DISTRIBUTOR_SUMMARY_REPORT_NAME: (["distributor_sales"], config.RAW_DISTRIBUTOR_DATA_REPORT_HEADERS),
+    config.CUSTOMER_SUMMARY_REPORT_NAME: (["sales"], config.CUSTOMER_SUMMARY_REPORT_HEADERS),
+    config.PRODUCT_SUMMARY_REPORT_NAME: (["sales", "products"], config.PRODUCT_SUMMARY_REPORT_HEADERS),
+    config.RAW_DATA_REPORT_NAME: (["sales"], config.RAW_DATA_REPORT_HEADERS)
+}
+
+FIGURE_INPUTS = ["sales", "distributor_sales"]
+
+### Fingerprints ###
+
+def file_state(file_name):
+    # Size and modification time stand in for the contents (hashing large logs would cost
+    # more than most exports); None if the file is missing
+    data_io.flush_appends(file_name)
+    try:
+        stat = os.stat(file_name)
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+def digest(value):
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode()).hexdigest()
+
+### Cache ###
+
+class ExportCache:
+    # Records the digest of what each sheet and figure was built from (input file states, the
+    # config values that shape it, the day window) and the state of the file it was written to.
+    # An output is current while both still match.
+    def __init__(self, store, day_window=None, file_name=config.EXPORT_CACHE):
+        self.file_name = file_name
+        self.day_window = list(day_window) if day_window is not None else None
+        self.inputs = {
+            name: {stored_file: file_state(stored_file) for stored_file in store.stored_files(data_file)}
+            for name, data_file in INPUT_FILES.items()
+        }
+        try:
+            with open(file_name, mode="r") as file:
+                cache = json.load(file)
+        except (FileNotFoundError, ValueError):
+            cache = {}
+        self.entries = cache.get("entries", {}) if cache.get("version") == CACHE_VERSION else {}
+
+    def input_digest(self, inputs, settings):
+        return digest([settings, self.day_window, [self.inputs[name] for name in inputs]])
+
+    def is_current(self, key, output_file, output_digest):
+        entry = self.entries.get(key)
+        return (
+            entry is not None
+            and entry["digest"] == output_digest
+            and entry["state"] == file_state(output_file)
+        )
+
+    def record(self, key, output_file, output_digest):
+        self.entries[key] = {"digest": output_digest, "state": file_state(output_file)}
+
+    def save(self):
+        temp_file = self.file_name + ".tmp"
+        with open(temp_file, mode="w") as file:
+            json.dump({"version": CACHE_VERSION, "entries": self.entries}, file, indent=2)
+        os.replace(temp_file, self.file_name)
+
+    ### Workbook ###
+
+    def sheet_digest(self, title):
+        inputs, headers = SHEETS[title]
+        # Sheet names and order decide where each sheet sits in the workbook file
+        return self.input_digest(inputs, [list(SHEETS), title, headers, config.FONT_COLOR, config.CELL_COLOR])
+
+    def current_sheets(self, output_file):
+        # Sheets that can be copied unchanged from the existing workbook
+        return {
+            title for title in SHEETS
+            if self.is_current(f"{output_file}:{title}", output_file, self.sheet_digest(title))
+        }
+
+    def workbook_is_current(self, output_file):
+        return len(self.current_sheets(output_file)) == len(SHEETS)
+
+    def record_workbook(self, output_file):
+        for title in SHEETS:
+            self.record(f"{output_file}:{title}", output_file, self.sheet_digest(title))
+
+    ### Figures ###
+
+    def figure_digest(self, figure, output_file):
+        return self.input_digest(FIGURE_INPUTS, [figure, output_file])
+
+    def figure_is_current(self, figure, output_file):
+        return self.is_current(output_file, output_file, self.figure_digest(figure, output_file))
+
+    def record_figure(self, figure, output_file):
+        self.record(output_file, output_file, self.figure_digest(figure, output_file))
@@ -0,0 +1,88 @@
+# Standard Library Imports
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Local Application Imports
+import modules.config as config
+import modules.profiling as profiling
+import modules.records as records
+
+def plot_column_over_days(days, values, title, y_label, output_filename, color="tab:blue"):
+    # matplotlib is imported on first render, so checking figure paths stays cheap
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib.figure import Figure
+
+    # Object-oriented API only, so each worker process renders without pyplot state
+    fig = Figure(figsize=(10, 6))
+    ax = fig.add_subplot()
+    ax.plot(days, values, marker="o", linestyle="-", color=color)
+    ax.set_title(title)
+    ax.set_xlabel("Day")
+    ax.set_ylabel(y_label)
+    ax.grid(True)
+    fig.tight_layout()
+    fig.savefig(output_filename)
+    return output_filename
+
+def figure_output_path(file_name, output_dir=None, figure_format=None):
+    if output_dir is not None:
+        file_name = os.path.join(output_dir, os.path.basename(file_name))
+    if figure_format is not None:
+        file_name = f"{os.path.splitext(file_name)[0]}.{figure_format}"
+    return file_name
+
+def export_figures(daily_summary=None, workers=None, output_dir=None, figure_format=None, report_file=None,
+                   day_window=None, daily_figures=None):
+    # Accepts a DataFrame or a dict of column arrays (see daily_summary_columns);
+    # reading the exported workbook back is only a fallback for standalone use
+    df = daily_summary
+    if df is None:
+        # pandas is only needed for this fallback, so it is imported here
+        import pandas as pd
+        with profiling.stage("read_excel"):
+            df = pd.read_excel(
+                report_file or config.BUSINESS_REPORT,
+                sheet_name=config.DAILY_SUMMARY_REPORT_NAME,
+                engine="openpyxl"
+            )
+
+    if workers is None:
+        workers = config.FIGURE_WORKERS or os.cpu_count() or 1
+    if daily_figures is None:
+        daily_figures = config.DAILY_FIGURES
+
+    days = list(df["DAY"])
+    # Only the days inside day_window (first_day, last_day) are plotted
+    positions = range(len(days))
+    if day_window is not None:
+        positions = [i for i, day in enumerate(days) if records.in_day_window(day, day_window)]
+        days = [days[i] for i in positions]
+    jobs = []
+    for figure in daily_figures:
+        values = list(df[figure["column"]])
+        output_filename = figure_output_path(figure["file"], output_dir, figure_format)
+        os.makedirs(os.path.dirname(output_filename) or ".", exist_ok=True)
+        jobs.append((
+            days,
+            [values[i] for i in positions],
+            figure["title"],
+            figure["y_label"],
+            output_filename,
+            figure["color"]
+        ))
+
+    # Render each chart in its own process (timed as a whole, since the work happens in the workers)
+    if workers > 1 and len(jobs) > 1:
+        with profiling.stage("render_figures"):
+            with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+                futures = [executor.submit(plot_column_over_days, *job) for job in jobs]
+                output_filenames = [future.result() for future in futures]
+    else:
+        output_filenames = []
+        for job in jobs:
+            with profiling.stage(f"render_figure {os.path.basename(job[4])}"):
+                output_filenames.append(plot_column_over_days(*job))
+
+    for output_filename in output_filenames:
+        print(f"{output_filename} exported successfully.")
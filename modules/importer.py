@@ -0,0 +1,230 @@
+# Standard Library Imports
+import csv
+import json
+import os
+
+# Local Application Imports
+import modules.config as config
+import modules.customer_journal as customer_journal
+import modules.sales as sales
+import modules.storage as storage
+
+# Record types (the optional TYPE column/key, customer by default)
+CUSTOMER = "customer"
+DISTRIBUTOR = "distributor"
+
+TRUE_VALUES = {"1", "true", "yes", "y"}
+FALSE_VALUES = {"0", "false", "no", "n", ""}
+
+MAX_REPORTED_ERRORS = 20
+
+### Reading ###
+
+def read_records(file_name):
+    # Yields (line number, record) pairs with lower-case keys, from CSV or JSON Lines
+    if os.path.splitext(file_name)[1].lower() in (".jsonl", ".ndjson"):
+        with open(file_name, mode="r") as file:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                # Valid JSON that is not an object (a list, string or number) is a bad line too
+                if not isinstance(record, dict):
+                    yield line_number, None
+                    continue
+                yield line_number, {str(key).lower(): value for key, value in record.items()}
+    else:
+        with open(file_name, mode="r", newline="") as file:
+            reader = csv.DictReader(file)
+            for record in reader:
+                yield reader.line_num, {key.lower(): value for key, value in record.items() if key}
+
+### Validation ###
+
+def parse_int(value):
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+def parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    text = str(value if value is not None else "").strip().lower()
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    return None
+
+def parse_record_products(value, product_prices, errors):
+    # Accepts "NAME:UNITS|NAME:UNITS" (any PRICE part is ignored), {"NAME": UNITS},
+    # or a list of [NAME, UNITS] pairs / {"name": ..., "units": ...} objects
+    if isinstance(value, str):
+        entries = [entry.split(":")[:2] for entry in value.split("|") if entry]
+    elif isinstance(value, dict):
+        entries = list(value.items())
+    elif isinstance(value, list):
+        entries = [
+            (entry.get("name"), entry.get("units")) if isinstance(entry, dict) else entry
+            for entry in value
+        ]
+    else:
+        entries = []
+
+    products = []
+    for entry in entries:
+        # Checked before any lookup, since JSON can put numbers, lists or objects anywhere
+        if not isinstance(entry, (list, tuple)) or len(entry) != 2:
+            errors.append(f"invalid product entry {entry!r}")
+            continue
+        name, units = entry
+        units = parse_int(units)
+        if not isinstance(name, str):
+            errors.append(f"invalid product name {name!r}")
+        elif name not in product_prices:
+            errors.append(f"unknown product {name!r}")
+        elif units is None or units <= 0:
+            errors.append(f"invalid units for {name}")
+        else:
+            # Price comes from the product data, as in the sale menus
+            products.append([name, units, product_prices[name]])
+
+    if not entries:
+        errors.append("no products")
+    return products
+
+def get_field(record, *names):
+    for name in names:
+        value = record.get(name)
+        if value not in (None, ""):
+            return value.strip() if isinstance(value, str) else value
+    return None
+
+### Import ###
+
+def import_sales_file(file_name, products, customer_data, distributor_names):
+    product_prices = {product.name: product.sell_price for product in products}
+
+    sale_rows = []
+    distributor_rows = []
+    # Customers touched by the batch; copied so nothing changes in memory unless it all imports
+    updated_customers = {}
+    new_distributors = []
+    journal_rows = []
+    errors = []
+
+    # Validate the whole batch before anything is written
+    for line_number, record in read_records(file_name):
+        record_errors = []
+        if record is None:
+            errors.append(f"line {line_number}: not a valid JSON object")
+            continue
+
+        record_type = str(get_field(record, "type") or CUSTOMER).lower()
+        day = parse_int(get_field(record, "day"))
+        total_sales = parse_int(get_field(record, "total_sales", "total sales"))
+        products = parse_record_products(get_field(record, "products") or "", product_prices, record_errors)
+
+        if day is None:
+            record_errors.append("invalid day")
+        if total_sales is None:
+            record_errors.append("invalid total sales")
+
+        if record_type == CUSTOMER:
+            customer_name = get_field(record, "customer")
+            region = get_field(record, "region")
+            location = get_field(record, "location")
+            time_of_day = get_field(record, "time_of_day", "time of day")
+            relationship = get_field(record, "relationship")
+
+            if not customer_name:
+                record_errors.append("missing customer")
+            elif not isinstance(customer_name, str):
+                record_errors.append(f"invalid customer {customer_name!r}")
+            elif customer_name not in customer_data and customer_name not in updated_customers:
+                if region not in config.CUSTOMER_REGIONS:
+                    record_errors.append(f"new customer {customer_name!r} needs a valid region")
+            if not location:
+                record_errors.append("missing location")
+            elif not isinstance(location, str):
+                record_errors.append(f"invalid location {location!r}")
+            if time_of_day not in config.TIME_OF_DAY_OPTIONS:
+                record_errors.append(f"invalid time of day {time_of_day!r}")
+            if relationship not in config.RELATIONSHIP_OPTIONS:
+                record_errors.append(f"invalid relationship {relationship!r}")
+
+            if not record_errors:
+                if customer_name not in updated_customers:
+                    existing = customer_data.get(customer_name)
+                    updated_customers[customer_name] = {
+                        "REGION": existing["REGION"] if existing else region,
+                        "LOCATIONS": set(existing["LOCATIONS"]) if existing else set(),
+                        "RELATIONSHIP": existing["RELATIONSHIP"] if existing else ""
+                    }
+                customer = updated_customers[customer_name]
+                if location not in customer["LOCATIONS"]:
+                    customer["LOCATIONS"].add(location)
+                    journal_rows.append([customer_name, customer_journal.LOCATION, location])
+                if relationship != customer["RELATIONSHIP"]:
+                    customer["RELATIONSHIP"] = relationship
+                    journal_rows.append([customer_name, customer_journal.RELATIONSHIP, relationship])
+
+                sale_rows.append(sales.build_sale_row(
+                    day, customer_name, products, total_sales, location, time_of_day, relationship
+                ))
+
+        elif record_type == DISTRIBUTOR:
+            distributor = get_field(record, "distributor")
+            cut_included = parse_bool(get_field(record, "cut_included", "cut included"))
+
+            if not distributor:
+                record_errors.append("missing distributor")
+            elif not isinstance(distributor, str):
+                record_errors.append(f"invalid distributor {distributor!r}")
+            if cut_included is None:
+                record_errors.append("invalid cut_included")
+
+            if not record_errors:
+                if distributor not in distributor_names and distributor not in new_distributors:
+                    new_distributors.append(distributor)
+                distributor_rows.append(sales.build_distributor_sale_row(
+                    day, distributor, products, total_sales, cut_included
+                ))
+
+        else:
+            record_errors.append(f"unknown type {record_type!r}")
+
+        errors.extend(f"line {line_number}: {error}" for error in record_errors)
+
+    if errors:
+        print(f"{file_name} not imported ({len(errors)} errors):")
+        for error in errors[:MAX_REPORTED_ERRORS]:
+            print(f"- {error}")
+        if len(errors) > MAX_REPORTED_ERRORS:
+            print(f"- ... and {len(errors) - MAX_REPORTED_ERRORS} more")
+        return None
+
+    # Write each file in one buffered append
+    new_customer_rows = [
+        [name, data["REGION"], "", ""]
+        for name, data in updated_customers.items() if name not in customer_data
+    ]
+    if new_customer_rows:
+        storage.append_rows(config.CUSTOMER_DATA_CSV, new_customer_rows)
+    customer_data.update(updated_customers)
+    if journal_rows:
+        storage.append_rows(config.CUSTOMER_JOURNAL_CSV, journal_rows)
+    if new_distributors:
+        storage.append_rows(config.DISTRIBUTOR_NAMES_CSV, [[name] for name in new_distributors])
+        distributor_names.update(new_distributors)
+    if sale_rows:
+        storage.append_rows(config.SALES_DATA_CSV, sale_rows)
+    if distributor_rows:
+        storage.append_rows(config.DISTRIBUTOR_SALES_DATA_CSV, distributor_rows)
+
+    print(f"{file_name} imported: {len(sale_rows)} customer sales, {len(distributor_rows)} distributor sales.")
+    return sale_rows, distributor_rows
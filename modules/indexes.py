@@ -0,0 +1,38 @@
+# Standard Library Imports
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+### Customer Index ###
+
+def region_key(region):
+    return region.strip().lower()
+
+class CustomerIndex:
+    # Region -> sorted customer names and customer -> sorted locations, kept in step
+    # with customer_data so the sale menus never rescan or re-sort it
+    def __init__(self, customer_data=None):
+        self.customers_by_region = defaultdict(list)
+        self.locations_by_customer = {}
+        for name, data in (customer_data or {}).items():
+            self.customers_by_region[region_key(data["REGION"])].append(name)
+            self.locations_by_customer[name] = sorted(data.get("LOCATIONS", ()))
+        for customers in self.customers_by_region.values():
+            customers.sort()
+
+    def customers_in_region(self, region):
+        return self.customers_by_region.get(region_key(region), [])
+
+    def locations(self, customer_name):
+        return self.locations_by_customer.get(customer_name, [])
+
+    def add_customer(self, customer_name, region):
+        if customer_name in self.locations_by_customer:
+            return
+        insort(self.customers_by_region[region_key(region)], customer_name)
+        self.locations_by_customer[customer_name] = []
+
+    def add_location(self, customer_name, location):
+        locations = self.locations_by_customer.setdefault(customer_name, [])
+        position = bisect_left(locations, location)
+        if position == len(locations) or locations[position] != location:
+            locations.insert(position, location)
@@ -0,0 +1,43 @@
+# Local Application Imports
+import modules.aggregation as aggregation
+import modules.config as config
+
+### Live Report ###
+
+class LiveReport:
+    # The export aggregates (daily totals, customer running sums, product units and sales),
+    # kept current while sales are recorded so exports only render them. They are the export
+    # checkpoint: each refresh folds in whatever was stored after the saved positions (byte
+    # offsets in the CSV logs, sale ids in SQLite), so sales from any path (menus, imports)
+    # are counted once, and a crash before save() only means the next refresh reads a few more rows.
+    def __init__(self, store, checkpoint_file=config.EXPORT_CHECKPOINT):
+        self.store = store
+        self.checkpoint_file = checkpoint_file
+        self.changed = False
+        self.report, self.positions = store.resume_report(checkpoint_file)
+        self.refresh()
+
+    def refresh(self):
+        # Call after sales are stored; their rows are read back from storage
+        positions = self.store.fold_new_rows(self.report, self.positions)
+        if positions != self.positions:
+            self.positions = positions
+            self.changed = True
+
+    def save(self):
+        if not self.changed:
+            return
+        aggregation.save_checkpoint(
+            self.checkpoint_file,
+            self.report,
+            self.store.checkpoint_states(self.positions)
+        )
+        self.changed = False
+
+    ### Queries ###
+
+    def latest_day(self):
+        return max(self.report["daily"], default=None)
+
+    def day_summary(self, day):
+        return self.report["daily"].get(day)
@@ -0,0 +1,103 @@
+# Standard Library Imports
+import cProfile
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+### Stage Timing ###
+
+# Off unless enable() is called (main.py --profile); stage() is then a no-op
+enabled = False
+trace_file = None
+profile_file = None
+profiler = None
+started = None
+stages = []
+open_stages = []
+
+def enable(trace=None, profile=None):
+    global enabled, trace_file, profile_file, profiler, started
+    enabled = True
+    trace_file = trace
+    profile_file = profile
+    started = time.perf_counter()
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if profile_file:
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+@contextmanager
+def stage(name):
+    if not enabled:
+        yield
+        return
+
+    # Nested stages are recorded as "parent/child"; the parent's peak includes its children
+    if open_stages:
+        parent = open_stages[-1]
+        parent["peak"] = max(parent["peak"], tracemalloc.get_traced_memory()[1])
+        name = f"{parent['name']}/{name}"
+    tracemalloc.reset_peak()
+    current = {"name": name, "peak": 0}
+    open_stages.append(current)
+    # Added on entry, so the trace lists stages in the order they started
+    entry = {"stage": name}
+    stages.append(entry)
+
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - start_wall
+        cpu = time.process_time() - start_cpu
+        open_stages.pop()
+        peak = max(current["peak"], tracemalloc.get_traced_memory()[1])
+        if open_stages:
+            open_stages[-1]["peak"] = max(open_stages[-1]["peak"], peak)
+        entry.update({
+            "start_seconds": round(start_wall - started, 4),
+            "wall_seconds": round(wall, 4),
+            "cpu_seconds": round(cpu, 4),
+            "peak_memory_bytes": peak
+        })
+
+### Reporting ###
+
+def print_summary():
+    width = max(len(entry["stage"]) for entry in stages)
+    print(f"{'STAGE':<{width}} {'WALL':>9} {'CPU':>9} {'PEAK MEM':>11}")
+    for entry in stages:
+        print(
+            f"{entry['stage']:<{width}} {entry['wall_seconds']:>8.3f}s {entry['cpu_seconds']:>8.3f}s "
+            f"{entry['peak_memory_bytes'] / 2**20:>7.1f} MiB"
+        )
+
+def finish():
+    global enabled
+    if not enabled:
+        return
+    enabled = False
+
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(profile_file)
+        print(f"{profile_file} written (open with python -m pstats).")
+    tracemalloc.stop()
+
+    if not stages:
+        return
+    print_summary()
+    if trace_file:
+        with open(trace_file, mode="w") as file:
+            json.dump({
+                "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "argv": sys.argv,
+                "total_seconds": round(time.perf_counter() - started, 4),
+                "stages": stages
+            }, file, indent=2)
+        print(f"{trace_file} written.")
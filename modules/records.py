@@ -0,0 +1,84 @@
+# Standard Library Imports
+from typing import NamedTuple
+
+# Local Application Imports
+import modules.config as config
+import modules.data_io as data_io
+
+### Sale Records ###
+
+class SaleRecord(NamedTuple):
+    day: int
+    customer: str
+    units_sold: int
+    total_sales: float
+    real_rate: float
+    ask_rate: float
+    products: list  # [name, units, price] entries in logged order
+    location: str
+    time_of_day: str
+    relationship: str
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(
+            int(row[0]),
+            row[1],
+            int(row[2]),
+            float(row[3]),
+            float(row[4]),
+            float(row[5]),
+            data_io.parse_products_string(row[6]),
+            row[7],
+            row[8],
+            row[9]
+        )
+
+class DistributorSaleRecord(NamedTuple):
+    day: int
+    distributor: str
+    units_sold: int
+    gross_sales: float
+    net_sales: float
+    real_rate: float
+    ask_rate: float
+    products: list  # [name, units, price] entries in logged order
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(
+            int(row[0]),
+            row[1],
+            int(row[2]),
+            float(row[3]),
+            float(row[4]),
+            float(row[5]),
+            float(row[6]),
+            data_io.parse_products_string(row[7])
+        )
+
+### Day Windows ###
+
+def in_day_window(day, day_window):
+    # day_window is (first_day, last_day); either end may be None (open)
+    first_day, last_day = day_window
+    return (first_day is None or day >= first_day) and (last_day is None or day <= last_day)
+
+### Readers ###
+
+def sale_records(rows):
+    # Converts rows lazily, so only one record is alive at a time
+    for row in rows:
+        if row:
+            yield SaleRecord.from_row(row)
+
+def distributor_sale_records(rows):
+    for row in rows:
+        if row:
+            yield DistributorSaleRecord.from_row(row)
+
+def iter_sales(store, day_window=None):
+    return sale_records(store.iter_rows(config.SALES_DATA_CSV, day_window))
+
+def iter_distributor_sales(store, day_window=None):
+    return distributor_sale_records(store.iter_rows(config.DISTRIBUTOR_SALES_DATA_CSV, day_window))
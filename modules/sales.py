@@ -0,0 +1,55 @@
+### Sale Rows ###
+
+# Distributors keep this share of the gross sale
+DISTRIBUTOR_NET_SHARE = 0.8
+
+def serialize_products(products):
+    return "|".join(
+        f"{name}:{units}:{price}" for name, units, price in products
+    )
+
+def calculate_rates(sales_amount, products):
+    # Real (actual) rate
+    total_units = sum(units for _, units, _ in products)
+    real_rate = round((sales_amount / total_units), 2)
+
+    # Ask (expected) rate
+    total_ask_value = sum(units * price for _, units, price in products)
+    ask_rate = round(total_ask_value / total_units, 2)
+
+    return total_units, real_rate, ask_rate
+
+def build_sale_row(day, customer_name, products, total_sales, location, time_of_day, relationship_level):
+    total_units, real_rate, ask_rate = calculate_rates(total_sales, products)
+    return [
+        day,
+        customer_name,
+        total_units,
+        total_sales,
+        real_rate,
+        ask_rate,
+        serialize_products(products),
+        location,
+        time_of_day,
+        relationship_level
+    ]
+
+def build_distributor_sale_row(day, distributor, products, total_sales, cut_included):
+    if cut_included:
+        gross_sales = int(total_sales / DISTRIBUTOR_NET_SHARE)
+        net_sales = total_sales
+    else:
+        gross_sales = total_sales
+        net_sales = int(total_sales * DISTRIBUTOR_NET_SHARE)
+
+    total_units, real_rate, ask_rate = calculate_rates(gross_sales, products)
+    return [
+        day,
+        distributor,
+        total_units,
+        gross_sales,
+        net_sales,
+        real_rate,
+        ask_rate,
+        serialize_products(products)
+    ]
@@ -0,0 +1,114 @@
+# Standard Library Imports
+import math
+
+# Local Application Imports
+import modules.config as config
+
+# Values are counted in log-spaced buckets, each covering (GAMMA^(i-1), GAMMA^i], so any quantile
+# comes back within QUANTILE_SKETCH_ACCURACY of a value that was added
+GAMMA = (1 + config.QUANTILE_SKETCH_ACCURACY) / (1 - config.QUANTILE_SKETCH_ACCURACY)
+LOG_GAMMA = math.log(GAMMA)
+
+# Zero and negative values share one bucket below all the others
+ZERO_BUCKET = -(2 ** 31)
+
+def bucket_index(value):
+    if value <= 0:
+        return ZERO_BUCKET
+    return math.ceil(math.log(value) / LOG_GAMMA)
+
+def bucket_value(index):
+    if index == ZERO_BUCKET:
+        return 0.0
+    return 2 * GAMMA ** index / (GAMMA + 1)
+
+### Quantile Sketch ###
+
+class QuantileSketch:
+    # Bucket counts instead of the values themselves, so memory depends on the spread of the
+    # values (about 175 buckets for $30 to $1000 at 1%), never on how many were added.
+    # Sketches built from different parts of a log merge into the sketch of the whole log.
+    # The smallest and largest values are kept exactly, and every quantile stays between them.
+    def __init__(self, buckets=None, minimum=None, maximum=None):
+        self.buckets = buckets if buckets is not None else {}
+        self.count = sum(self.buckets.values())
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def __eq__(self, other):
+        # Same counts in the same buckets and the same bounds (used by the pandas parity check)
+        if not isinstance(other, QuantileSketch):
+            return NotImplemented
+        return (
+            self.count == other.count
+            and self.buckets == other.buckets
+            and self.minimum == other.minimum
+            and self.maximum == other.maximum
+        )
+
+    def add(self, value):
+        self.add_bucket(bucket_index(value), 1)
+        self.add_bounds(value, value)
+
+    def add_bucket(self, index, count):
+        self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += count
+        if len(self.buckets) > config.QUANTILE_SKETCH_MAX_BUCKETS:
+            self.collapse()
+
+    def add_bounds(self, minimum, maximum):
+        # Widens the exact bounds; callers that fill buckets with add_bucket report them here
+        self.minimum = minimum if self.minimum is None else min(self.minimum, minimum)
+        self.maximum = maximum if self.maximum is None else max(self.maximum, maximum)
+
+    def merge(self, other):
+        for index, count in other.buckets.items():
+            self.add_bucket(index, count)
+        if other.count:
+            self.add_bounds(other.minimum, other.maximum)
+
+    def collapse(self):
+        # Folds the lowest buckets into the next one up, so only the smallest values lose accuracy
+        indexes = sorted(self.buckets)
+        excess = len(indexes) - config.QUANTILE_SKETCH_MAX_BUCKETS
+        folded = sum(self.buckets.pop(index) for index in indexes[:excess])
+        self.buckets[indexes[excess]] += folded
+
+    def value_at(self, position):
+        # The position-th smallest value (from 0): exact at either end, else its bucket's value
+        if position == 0:
+            return self.minimum
+        if position == self.count - 1:
+            return self.maximum
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > position:
+                return min(max(bucket_value(index), self.minimum), self.maximum)
+        return self.maximum
+
+    def quantile(self, q):
+        # Interpolates between the two nearest values, like numpy's default and Excel's MEDIAN
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        position = math.floor(rank)
+        value = self.value_at(position)
+        if rank > position:
+            value += (rank - position) * (self.value_at(position + 1) - value)
+        return value
+
+    def to_json(self):
+        return {
+            "buckets": {str(index): count for index, count in self.buckets.items()},
+            "minimum": self.minimum,
+            "maximum": self.maximum
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(
+            {int(index): count for index, count in data["buckets"].items()},
+            data["minimum"],
+            data["maximum"]
+        )
@@ -0,0 +1,138 @@
+# Standard Library Imports
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Local Application Imports
+import modules.config as config
+
+# Third-party libraries that must only load when exporting
+HEAVY_MODULES = ["matplotlib", "numpy", "openpyxl", "pandas"]
+
+# The directory holding main.py, so probes can import it from a data directory
+PROJECT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a fresh interpreter: imports main.py the way a launch does, then (given a backend)
+# loads the data from data_dir the way the menus do
+STARTUP_PROBE = """
+import contextlib
+import io
+import os
+import sys
+import time
+sys.path.insert(0, {project_directory!r})
+start = time.perf_counter()
+import main
+import_time = time.perf_counter() - start
+initialize_time = 0.0
+if {backend!r} is not None:
+    import modules.config as config
+    os.chdir({data_dir!r})
+    config.STORAGE_BACKEND = {backend!r}
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        main.initialize()
+        initialize_time = time.perf_counter() - start
+        main.current_report.save()
+print(import_time)
+print(initialize_time)
+print(",".join(name for name in {heavy_modules!r} if name in sys.modules))
+"""
+
+def run_probe(backend=None, data_dir=None):
+    probe = STARTUP_PROBE.format(
+        project_directory=PROJECT_DIRECTORY,
+        backend=backend,
+        data_dir=data_dir,
+        heavy_modules=HEAVY_MODULES
+    )
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    process_time = time.perf_counter() - start
+
+    import_time, initialize_time, loaded = result.stdout.splitlines()[-3:]
+    return process_time, float(import_time), float(initialize_time), {name for name in loaded.split(",") if name}
+
+def measure_startup(runs=5):
+    process_times = []
+    import_times = []
+    heavy_modules = set()
+
+    for _ in range(runs):
+        process_time, import_time, _, loaded = run_probe()
+        process_times.append(process_time)
+        import_times.append(import_time)
+        heavy_modules.update(loaded)
+
+    return {
+        "process_seconds": statistics.median(process_times),
+        "import_seconds": statistics.median(import_times),
+        "heavy_modules": sorted(heavy_modules)
+    }
+
+def measure_initialize(backend, data_dir, runs=5):
+    # The first launch migrates the data and builds the export checkpoint, so it is not timed;
+    # the timed launches are the ones a user sees every day
+    run_probe(backend, data_dir)
+    initialize_times = []
+    heavy_modules = set()
+
+    for _ in range(runs):
+        _, _, initialize_time, loaded = run_probe(backend, data_dir)
+        initialize_times.append(initialize_time)
+        heavy_modules.update(loaded)
+
+    return {
+        "initialize_seconds": statistics.median(initialize_times),
+        "heavy_modules": sorted(heavy_modules)
+    }
+
+def check_startup(runs=5, sample_sales=None, backends=None):
+    # Imported here, since generating the sample is only needed for the check itself
+    import modules.synthetic_data as synthetic_data
+
+    if sample_sales is None:
+        sample_sales = config.STARTUP_SAMPLE_SALES
+    if backends is None:
+        backends = config.STARTUP_BACKENDS
+
+    result = measure_startup(runs)
+    print(f"Cold start: {result['process_seconds']:.3f}s (budget {config.STARTUP_TIME_BUDGET:.3f}s)")
+    print(f"Importing main.py: {result['import_seconds']:.3f}s")
+
+    passed = True
+    if result["heavy_modules"]:
+        print(f"⚠️  Loaded at startup: {', '.join(result['heavy_modules'])}")
+        passed = False
+    if result["process_seconds"] > config.STARTUP_TIME_BUDGET:
+        print("⚠️  Startup is over budget.")
+        passed = False
+
+    # Every backend gets its own copy of the sample, since each migrates it differently
+    for backend in backends:
+        with tempfile.TemporaryDirectory(prefix=f"startup_{backend}_") as data_dir:
+            synthetic_data.generate_dataset(data_dir, sample_sales)
+            result = measure_initialize(backend, data_dir, runs)
+
+        print(
+            f"Loading {sample_sales} sales ({backend}): {result['initialize_seconds']:.3f}s "
+            f"(budget {config.INITIALIZE_TIME_BUDGET:.3f}s)"
+        )
+        if result["heavy_modules"]:
+            print(f"⚠️  Loaded while loading data ({backend}): {', '.join(result['heavy_modules'])}")
+            passed = False
+        if result["initialize_seconds"] > config.INITIALIZE_TIME_BUDGET:
+            print(f"⚠️  Loading data ({backend}) is over budget.")
+            passed = False
+    return passed
+
+if __name__ == "__main__":
+    sys.exit(0 if check_startup() else 1)
@@ -0,0 +1,666 @@
+# Standard Library Imports
+import hashlib
+import json
+import os
+import sqlite3
+
+# Local Application Imports
+import modules.aggregation as aggregation
+import modules.config as config
+import modules.data_io as io
+import modules.records as records
+import modules.sketch as sketch
+
+### CSV Backend ###
+
+class CsvStorage:
+    # Report aggregates are checkpointed against byte offsets in the log files
+    def load_list(self, file_name, headers):
+        return io.load_or_create_list_csv(file_name, headers)
+
+    def load_dict(self, file_name, headers, key_field):
+        return io.load_or_create_dict_csv(file_name, headers, key_field)
+
+    def load_set(self, file_name, headers):
+        return io.load_or_create_set_csv(file_name, headers)
+
+    def iter_rows(self, file_name, day_window=None):
+        rows = io.iter_csv_rows(file_name)
+        if day_window is None:
+            return rows
+        # A single log has to be scanned in full; the partitioned backend skips files instead
+        return (row for row in rows if records.in_day_window(int(row[0]), day_window))
+
+    def ensure_exists(self, file_name, headers):
+        io.create_csv_if_missing(file_name, headers)
+
+    def stored_files(self, file_name):
+        # The files a data set is stored in, in read order
+        return [file_name]
+
+    def latest_day(self):
+        return max(
+            (int(row[0]) for file_name in SALES_LOGS for row in self.iter_rows(file_name)),
+            default=None
+        )
+
+    def write_rows(self, file_name, rows, headers=None):
+        io.write_csv(file_name, rows, headers=headers)
+
+    def append_row(self, file_name, row):
+        io.append_csv(file_name, row)
+
+    def append_rows(self, file_name, rows):
+        io.append_rows_csv(file_name, rows)
+
+    ### Checkpoint ###
+
+    def report_sources(self):
+        # Listed on every call, since partitioned logs gain files as new days are logged
+        return aggregation.report_sources(
+            self.stored_files(config.SALES_DATA_CSV),
+            self.stored_files(config.DISTRIBUTOR_SALES_DATA_CSV)
+        )
+
+    def resume_report(self, checkpoint_file):
+        # The checkpointed report and the log offsets it covers (see modules/live_report.py)
+        return aggregation.resume_report(self.report_sources(), checkpoint_file)
+
+    def fold_new_rows(self, report, offsets):
+        return aggregation.fold_appended_rows(report, self.report_sources(), offsets)
+
+    def checkpoint_states(self, offsets):
+        return aggregation.checkpoint_file_states(offsets)
+
+    def build_report_data(self, incremental=True, day_window=None):
+        if day_window is not None:
+            # Windowed reports only fold the rows in the window and are not checkpointed
+            return aggregation.build_report_data(
+                records.iter_sales(self, day_window),
+                records.iter_distributor_sales(self, day_window)
+            )
+        sales_files = self.stored_files(config.SALES_DATA_CSV)
+        distributor_files = self.stored_files(config.DISTRIBUTOR_SALES_DATA_CSV)
+        if incremental:
+            return aggregation.build_incremental_report_data(
+                sales_files,
+                distributor_files,
+                config.EXPORT_CHECKPOINT
+            )
+        if config.AGGREGATION_ENGINE == "pandas":
+            # Grouped pandas aggregation straight from the CSV logs (pandas is imported lazily)
+            import modules.vectorized as vectorized
+            return vectorized.build_report_data_from_csv(sales_files, distributor_files)
+        # Stream both logs through the fold functions one record at a time
+        return aggregation.build_report_data(
+            records.iter_sales(self),
+            records.iter_distributor_sales(self)
+        )
+
+### Partitioned CSV Backend ###
+
+# The sales logs, with their headers; the partitioned backend splits these by day
+SALES_LOGS = {
+    config.SALES_DATA_CSV: config.RAW_DATA_REPORT_HEADERS,
+    config.DISTRIBUTOR_SALES_DATA_CSV: config.RAW_DISTRIBUTOR_DATA_REPORT_HEADERS
+}
+
+MIGRATION_CHUNK_ROWS = 10000
+
+class PartitionedCsvStorage(CsvStorage):
+    # Each sales log is stored as one CSV per partition_days days under directory. The manifest
+    # records every partition's day range, so a windowed read opens only the files it needs.
+    # Every other file is a plain CSV, as in CsvStorage.
+    def __init__(self, directory, partition_days):
+        self.directory = directory
+        self.manifest_file = os.path.join(directory, "manifest.json")
+        is_new = not os.path.exists(self.manifest_file)
+        if is_new:
+            os.makedirs(directory, exist_ok=True)
+            self.manifest = {
+                "version": 1,
+                "partition_days": partition_days,
+                "logs": {file_name: {} for file_name in SALES_LOGS}
+            }
+        else:
+            with open(self.manifest_file, mode="r") as file:
+                self.manifest = json.load(file)
+            print(f"{self.manifest_file} opened.")
+        # Existing partitions keep the size they were created with
+        self.partition_days = self.manifest["partition_days"]
+        if is_new:
+            self.migrate_from_csv()
+
+    def migrate_from_csv(self):
+        # One-time split of the existing logs; the original CSV files are left in place
+        for file_name in SALES_LOGS:
+            chunk = []
+            for row in io.iter_csv_rows(file_name):
+                chunk.append(row)
+                if len(chunk) >= MIGRATION_CHUNK_ROWS:
+                    self.append_rows(file_name, chunk)
+                    chunk = []
+            self.append_rows(file_name, chunk)
+        self.save_manifest()
+        print(f"Existing sales logs migrated to {self.directory}.")
+
+    def save_manifest(self):
+        # Written to a temporary file first, so a crash never leaves a partial manifest
+        temp_file = self.manifest_file + ".tmp"
+        with open(temp_file, mode="w") as file:
+            json.dump(self.manifest, file, indent=2)
+        os.replace(temp_file, self.manifest_file)
+
+    def partition_range(self, day):
+        first_day = (day - 1) // self.partition_days * self.partition_days + 1
+        return first_day, first_day + self.partition_days - 1
+
+    def partition_path(self, partition):
+        return os.path.join(self.directory, partition["file"])
+
+    def partitions(self, file_name, day_window=None):
+        # The log's partitions in day order, limited to those overlapping day_window
+        partitions = sorted(self.manifest["logs"][file_name].values(), key=lambda x: x["first_day"])
+        if day_window is None:
+            return partitions
+        first_day, last_day = day_window
+        return [
+            partition for partition in partitions
+            if (first_day is None or partition["last_day"] >= first_day)
+            and (last_day is None or partition["first_day"] <= last_day)
+        ]
+
+    def add_partition(self, file_name, first_day, last_day):
+        base, extension = os.path.splitext(os.path.basename(file_name))
+        partition = {
+            "file": f"{base}_days_{first_day:05d}-{last_day:05d}{extension}",
+            "first_day": first_day,
+            "last_day": last_day,
+            "max_day": first_day
+        }
+        io.write_csv(self.partition_path(partition), [], headers=SALES_LOGS[file_name])
+        self.manifest["logs"][file_name][str(first_day)] = partition
+        return partition
+
+    def append_rows(self, file_name, rows):
+        if file_name not in SALES_LOGS:
+            super().append_rows(file_name, rows)
+            return
+
+        # Rows are grouped by partition, keeping their order within each partition
+        grouped = {}
+        for row in rows:
+            grouped.setdefault(self.partition_range(int(row[0])), []).append(row)
+
+        manifest_changed = False
+        for (first_day, last_day), partition_rows in grouped.items():
+            partition = self.manifest["logs"][file_name].get(str(first_day))
+            if partition is None:
+                partition = self.add_partition(file_name, first_day, last_day)
+                manifest_changed = True
+            io.append_rows_csv(self.partition_path(partition), partition_rows)
+            max_day = max(int(row[0]) for row in partition_rows)
+            if max_day > partition["max_day"]:
+                partition["max_day"] = max_day
+                manifest_changed = True
+        if manifest_changed:
+            self.save_manifest()
+
+    def append_row(self, file_name, row):
+        self.append_rows(file_name, [row])
+
+    def write_rows(self, file_name, rows, headers=None):
+        if file_name not in SALES_LOGS:
+            super().write_rows(file_name, rows, headers=headers)
+            return
+        for partition in self.partitions(file_name):
+            os.remove(self.partition_path(partition))
+        self.manifest["logs"][file_name] = {}
+        self.append_rows(file_name, rows)
+        self.save_manifest()
+
+    def iter_rows(self, file_name, day_window=None):
+        if file_name not in SALES_LOGS:
+            return super().iter_rows(file_name, day_window)
+        return self.iter_partition_rows(file_name, day_window)
+
+    def iter_partition_rows(self, file_name, day_window):
+        for partition in self.partitions(file_name, day_window):
+            rows = io.iter_csv_rows(self.partition_path(partition))
+            # Only partitions at the edges of the window hold days outside it
+            if day_window is not None and not (
+                records.in_day_window(partition["first_day"], day_window)
+                and records.in_day_window(partition["last_day"], day_window)
+            ):
+                rows = (row for row in rows if records.in_day_window(int(row[0]), day_window))
+            yield from rows
+
+    def load_list(self, file_name, headers):
+        if file_name not in SALES_LOGS:
+            return super().load_list(file_name, headers)
+        return [list(headers)] + list(self.iter_rows(file_name))
+
+    def ensure_exists(self, file_name, headers):
+        # Partitions are created as rows arrive
+        if file_name not in SALES_LOGS:
+            super().ensure_exists(file_name, headers)
+
+    def stored_files(self, file_name):
+        if file_name not in SALES_LOGS:
+            return super().stored_files(file_name)
+        return [self.partition_path(partition) for partition in self.partitions(file_name)]
+
+    def latest_day(self):
+        return max(
+            (partition["max_day"] for partitions in self.manifest["logs"].values() for partition in partitions.values()),
+            default=None
+        )
+
+### SQLite Backend ###
+
+# Each CSV file maps to a table with one column per CSV header
+SQLITE_TABLES = {
+    config.SALES_DATA_CSV: ("sales", [
+        ("day", "INTEGER"),
+        ("customer", "TEXT"),
+        ("units_sold", "INTEGER"),
+        ("total_sales", "REAL"),
+        ("real_rate", "REAL"),
+        ("ask_rate", "REAL"),
+        ("products", "TEXT"),
+        ("location", "TEXT"),
+        ("time_of_day", "TEXT"),
+        ("relationship", "TEXT")
+    ]),
+    config.DISTRIBUTOR_SALES_DATA_CSV: ("distributor_sales", [
+        ("day", "INTEGER"),
+        ("distributor", "TEXT"),
+        ("units_sold", "INTEGER"),
+        ("gross_sales", "REAL"),
+        ("net_sales", "REAL"),
+        ("real_rate", "REAL"),
+        ("ask_rate", "REAL"),
+        ("products", "TEXT")
+    ]),
+    config.PRODUCT_DATA_CSV: ("products", [
+        ("product", "TEXT"),
+        ("materials", "TEXT"),
+        ("timeframe", "INTEGER"),
+        ("yield", "INTEGER"),
+        ("sell_price", "INTEGER")
+    ]),
+    config.CUSTOMER_DATA_CSV: ("customers", [
+        ("customer", "TEXT"),
+        ("region", "TEXT"),
+        ("locations", "TEXT"),
+        ("relationship", "TEXT")
+    ]),
+    config.CUSTOMER_JOURNAL_CSV: ("customer_journal", [
+        ("customer", "TEXT"),
+        ("field", "TEXT"),
+        ("value", "TEXT")
+    ]),
+    config.PRODUCT_NAMES_CSV: ("product_names", [
+        ("product", "TEXT")
+    ]),
+    config.DISTRIBUTOR_NAMES_CSV: ("distributor_names", [
+        ("distributor", "TEXT")
+    ])
+}
+
+# Per-sale product lines (exploded from the products string) for grouping by product
+SALES_PRODUCT_TABLES = {
+    "sales": ("sale_products", 6),
+    "distributor_sales": ("distributor_sale_products", 7)
+}
+
+# Indexes the report queries use (grouping by day and customer, and joining product lines to their sale)
+SQLITE_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS sales_day ON sales (day)",
+    "CREATE INDEX IF NOT EXISTS sales_customer ON sales (customer)",
+    "CREATE INDEX IF NOT EXISTS sale_products_sale ON sale_products (sale_id)",
+    "CREATE INDEX IF NOT EXISTS distributor_sales_day ON distributor_sales (day)",
+    "CREATE INDEX IF NOT EXISTS distributor_sale_products_sale ON distributor_sale_products (sale_id)"
+]
+
+# The sales logs the report is built from; their tables are checkpointed by sale id
+SQLITE_REPORT_SOURCES = aggregation.report_sources([config.SALES_DATA_CSV], [config.DISTRIBUTOR_SALES_DATA_CSV])
+SQLITE_REPORT_TABLES = [SQLITE_TABLES[file_name][0] for file_name, _, _ in SQLITE_REPORT_SOURCES]
+
+class SqliteStorage:
+    # Full reports are grouped in SQL; the export checkpoint records the last sale id it
+    # covers in each table, so later reports only fold in newer rows
+
+    def __init__(self, database):
+        is_new = not os.path.exists(database)
+        self.database = database
+        self.connection = sqlite3.connect(database)
+        # Lets the percentile sketches be bucketed in SQL
+        self.connection.create_function("sketch_bucket", 1, sketch.bucket_index, deterministic=True)
+        self.create_schema()
+        if is_new:
+            print(f"{database} created.")
+            self.migrate_from_csv()
+        else:
+            print(f"{database} opened.")
+
+    def create_schema(self):
+        with self.connection:
+            for table, columns in SQLITE_TABLES.values():
+                column_definitions = ", ".join(f"{name} {column_type}" for name, column_type in columns)
+                self.connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY, {column_definitions})"
+                )
+            for product_table, _ in SALES_PRODUCT_TABLES.values():
+                # position: the order each product is counted in for its sale
+                self.connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {product_table} "
+                    "(sale_id INTEGER, position INTEGER, product TEXT, units INTEGER, price INTEGER)"
+                )
+            for statement in SQLITE_INDEXES:
+                self.connection.execute(statement)
+
+    def migrate_from_csv(self):
+        # One-time import of any existing CSV data into a new database
+        for file_name in SQLITE_TABLES:
+            if not os.path.exists(file_name):
+                continue
+            rows = io.load_or_create_list_csv(file_name, None)[1:]
+            self.insert_rows(file_name, [row for row in rows if row])
+        self.connection.commit()
+        print(f"Existing CSV data migrated to {self.database}.")
+
+    def insert_rows(self, file_name, rows):
+        table, columns = SQLITE_TABLES[file_name]
+        placeholders = ", ".join("?" for _ in columns)
+        column_names = ", ".join(name for name, _ in columns)
+        statement = f"INSERT INTO {table} ({column_names}) VALUES ({placeholders})"
+
+        product_table, products_index = SALES_PRODUCT_TABLES.get(table, (None, None))
+        for row in rows:
+            cursor = self.connection.execute(statement, list(row))
+            if product_table is None:
+                continue
+
+            parsed_products = io.parse_products_string(row[products_index])
+            if table == "sales":
+                parsed_products.sort(key=lambda x: x[1], reverse=True)
+            self.connection.executemany(
+                f"INSERT INTO {product_table} (sale_id, position, product, units, price) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (cursor.lastrowid, position, name, units, price)
+                    for position, (name, units, price) in enumerate(parsed_products)
+                ]
+            )
+
+    def select_rows(self, file_name, day_window=None):
+        table, columns = SQLITE_TABLES[file_name]
+        column_names = ", ".join(name for name, _ in columns)
+        if day_window is None:
+            return self.connection.execute(f"SELECT {column_names} FROM {table} ORDER BY id")
+        # Only the sales tables have a day column (indexed)
+        first_day, last_day = day_window
+        return self.connection.execute(
+            f"SELECT {column_names} FROM {table} WHERE day >= ? AND day <= ? ORDER BY id",
+            (first_day if first_day is not None else -2**63, last_day if last_day is not None else 2**63 - 1)
+        )
+
+    def load_list(self, file_name, headers):
+        return [list(headers)] + [list(row) for row in self.select_rows(file_name)]
+
+    def load_dict(self, file_name, headers, key_field):
+        key_index = headers.index(key_field)
+        data = {}
+        for row in self.select_rows(file_name):
+            if row[key_index]:
+                data[row[key_index]] = {
+                    header: value for i, (header, value) in enumerate(zip(headers, row)) if i != key_index
+                }
+        return data
+
+    def load_set(self, file_name, headers):
+        return {row[0] for row in self.select_rows(file_name)}
+
+    def iter_rows(self, file_name, day_window=None):
+        # The cursor fetches rows as they are consumed
+        return self.select_rows(file_name, day_window)
+
+    def ensure_exists(self, file_name, headers):
+        # Tables are created with the schema
+        pass
+
+    def write_rows(self, file_name, rows, headers=None):
+        table, _ = SQLITE_TABLES[file_name]
+        with self.connection:
+            product_table, _ = SALES_PRODUCT_TABLES.get(table, (None, None))
+            if product_table is not None:
+                self.connection.execute(f"DELETE FROM {product_table}")
+            self.connection.execute(f"DELETE FROM {table}")
+            self.insert_rows(file_name, rows)
+
+    def append_row(self, file_name, row):
+        with self.connection:
+            self.insert_rows(file_name, [row])
+
+    def append_rows(self, file_name, rows):
+        with self.connection:
+            self.insert_rows(file_name, rows)
+
+    def stored_files(self, file_name):
+        # Every table lives in the one database file
+        return [self.database]
+
+    def latest_day(self):
+        days = [
+            self.connection.execute(f"SELECT MAX(day) FROM {table}").fetchone()[0]
+            for table in ["sales", "distributor_sales"]
+        ]
+        return max((day for day in days if day is not None), default=None)
+
+    ### Checkpoint ###
+
+    def last_ids(self):
+        return {
+            table: self.connection.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0]
+            for table in SQLITE_REPORT_TABLES
+        }
+
+    def table_state(self, table, last_id):
+        # The row count up to last_id and a hash of that row, so deleted or rewritten sales are detected
+        rows = self.connection.execute(f"SELECT COUNT(*) FROM {table} WHERE id <= ?", (last_id,)).fetchone()[0]
+        last_row = self.connection.execute(f"SELECT * FROM {table} WHERE id = ?", (last_id,)).fetchone()
+        return {
+            "last_id": last_id,
+            "rows": rows,
+            "last_row_hash": hashlib.sha1(repr(last_row).encode()).hexdigest()
+        }
+
+    def checkpoint_states(self, last_ids):
+        return {table: self.table_state(table, last_id) for table, last_id in last_ids.items()}
+
+    def resume_report(self, checkpoint_file):
+        # The checkpointed report and the last sale ids it covers. Without a usable checkpoint
+        # the report is grouped in SQL and checkpointed straight away.
+        checkpoint = aggregation.load_checkpoint(checkpoint_file)
+        if checkpoint is not None and sorted(checkpoint["files"]) == sorted(SQLITE_REPORT_TABLES) and all(
+            self.table_state(table, state["last_id"]) == state
+            for table, state in checkpoint["files"].items()
+        ):
+            print("Resuming from export checkpoint.")
+            last_ids = {table: state["last_id"] for table, state in checkpoint["files"].items()}
+            return aggregation.report_from_json(checkpoint["report"]), last_ids
+
+        if checkpoint is not None:
+            print("Sales tables were rewritten. Rebuilding export checkpoint.")
+        last_ids = self.last_ids()
+        report = self.group_report_data()
+        aggregation.save_checkpoint(checkpoint_file, report, self.checkpoint_states(last_ids))
+        return report, last_ids
+
+    def fold_new_rows(self, report, last_ids):
+        # Folds in the rows after each table's last id; returns the new last ids
+        new_last_ids = {}
+        for file_name, add_record, to_records in SQLITE_REPORT_SOURCES:
+            table, columns = SQLITE_TABLES[file_name]
+            column_names = ", ".join(name for name, _ in columns)
+            last_id = last_ids.get(table, 0)
+            rows = self.connection.execute(
+                f"SELECT id, {column_names} FROM {table} WHERE id > ? ORDER BY id", (last_id,)
+            ).fetchall()
+            for record in to_records(row[1:] for row in rows):
+                add_record(report, record)
+            new_last_ids[table] = rows[-1][0] if rows else last_id
+        return new_last_ids
+
+    def build_report_data(self, incremental=True, day_window=None):
+        if day_window is not None:
+            # The window's rows come from the indexed day column and are folded one at a time
+            return aggregation.build_report_data(
+                records.iter_sales(self, day_window),
+                records.iter_distributor_sales(self, day_window)
+            )
+        if not incremental:
+            return self.group_report_data()
+        report, last_ids = self.resume_report(config.EXPORT_CHECKPOINT)
+        last_ids = self.fold_new_rows(report, last_ids)
+        aggregation.save_checkpoint(config.EXPORT_CHECKPOINT, report, self.checkpoint_states(last_ids))
+        return report
+
+    def group_report_data(self):
+        # Group in SQL; every query orders groups by first appearance so ties render
+        # in the same order as the row-by-row aggregation
+        report = aggregation.new_report_data()
+        execute = self.connection.execute
+
+        for day, sales, units, deals in execute(
+            "SELECT day, SUM(total_sales), SUM(units_sold), COUNT(*) FROM sales GROUP BY day"
+        ):
+            day_summary = report["daily"][day]
+            day_summary["my_sales"] = sales
+            day_summary["my_units_sold"] = units
+            day_summary["deals"] = deals
+
+        for day, sales, units in execute(
+            "SELECT day, SUM(gross_sales), SUM(units_sold) FROM distributor_sales GROUP BY day"
+        ):
+            day_summary = report["daily"][day]
+            day_summary["distributor_sales"] = sales
+            day_summary["distributor_units_sold"] = units
+
+        for day, customer, sales, units in execute(
+            "SELECT day, customer, SUM(total_sales), SUM(units_sold) FROM sales "
+            "GROUP BY day, customer ORDER BY MIN(id)"
+        ):
+            report["daily"][day]["customer_data"][customer] = {"sales": sales, "units": units}
+
+        for table, product_table, key in [
+            ("sales", "sale_products", "products"),
+            ("distributor_sales", "distributor_sale_products", "distributor_products")
+        ]:
+            for day, product, units in execute(
+                f"SELECT s.day, p.product, SUM(p.units) FROM {product_table} p "
+                f"JOIN {table} s ON s.id = p.sale_id "
+                "GROUP BY s.day, p.product ORDER BY MIN(p.sale_id * 1000 + p.position)"
+            ):
+                report["daily"][day][key][product] = units
+
+        for customer, sales, units, deals, rate_total, relationship in execute(
+            "SELECT customer, SUM(total_sales), SUM(units_sold), COUNT(*), SUM(real_rate), "
+            "(SELECT relationship FROM sales last WHERE last.customer = s.customer ORDER BY id DESC LIMIT 1) "
+            "FROM sales s GROUP BY customer"
+        ):
+            report["customers"][customer].update({
+                "total_sales": sales,
+                "units_total": units,
+                "deals": deals,
+                "rate_total": rate_total,
+                "relationship": relationship
+            })
+
+        for column, key in [("time_of_day", "times_of_day"), ("location", "locations")]:
+            for customer, value, count in execute(
+                f"SELECT customer, {column}, COUNT(*) FROM sales GROUP BY customer, {column} ORDER BY MIN(id)"
+            ):
+                report["customers"][customer][key][value] = count
+
+        for column, key in [("total_sales", "sale_sketch"), ("real_rate", "rate_sketch")]:
+            for customer, index, count in execute(
+                f"SELECT customer, sketch_bucket({column}), COUNT(*) FROM sales GROUP BY customer, 2"
+            ):
+                report["customers"][customer][key].add_bucket(index, count)
+            for customer, minimum, maximum in execute(
+                f"SELECT customer, MIN({column}), MAX({column}) FROM sales GROUP BY customer"
+            ):
+                report["customers"][customer][key].add_bounds(minimum, maximum)
+
+        # Sale totals are split across products by each product's share of units
+        for product, sales, units in execute(
+            "SELECT p.product, "
+            "SUM(CASE WHEN t.units > 0 THEN s.total_sales * (p.units * 1.0 / t.units) ELSE 0 END), "
+            "SUM(p.units) "
+            "FROM sale_products p "
+            "JOIN sales s ON s.id = p.sale_id "
+            "JOIN (SELECT sale_id, SUM(units) AS units FROM sale_products GROUP BY sale_id) t "
+            "ON t.sale_id = p.sale_id "
+            "GROUP BY p.product"
+        ):
+            report["products"][product] = {"sales": sales, "units": units}
+
+        return report
+
+### Backend Selection ###
+
+active_storage = None
+
+def open_storage():
+    # A new backend instance; worker processes open their own instead of sharing the parent's
+    if config.STORAGE_BACKEND == "sqlite":
+        return SqliteStorage(config.SQLITE_DATABASE)
+    if config.STORAGE_BACKEND == "partitioned":
+        return PartitionedCsvStorage(config.PARTITION_DIRECTORY, config.PARTITION_DAYS)
+    return CsvStorage()
+
+def get_storage():
+    global active_storage
+    if active_storage is None:
+        active_storage = open_storage()
+    return active_storage
+
+def load_list(file_name, headers):
+    return get_storage().load_list(file_name, headers)
+
+def load_dict(file_name, headers, key_field):
+    return get_storage().load_dict(file_name, headers, key_field)
+
+def load_set(file_name, headers):
+    return get_storage().load_set(file_name, headers)
+
+def write_rows(file_name, rows, headers=None):
+    get_storage().write_rows(file_name, rows, headers=headers)
+
+def append_row(file_name, row):
+    get_storage().append_row(file_name, row)
+
+def append_rows(file_name, rows):
+    get_storage().append_rows(file_name, rows)
+
+def iter_rows(file_name, day_window=None):
+    return get_storage().iter_rows(file_name, day_window)
+
+def ensure_exists(file_name, headers):
+    get_storage().ensure_exists(file_name, headers)
+
+def latest_day():
+    return get_storage().latest_day()
+
+def resolve_day_window(first_day=None, last_day=None, last_days=None):
+    # Turns the export options into a (first_day, last_day) window, or None for all days;
+    # last_days counts back from the latest logged day
+    if last_days is not None:
+        newest_day = latest_day()
+        if newest_day is None:
+            return None
+        first_day, last_day = newest_day - last_days + 1, newest_day
+    if first_day is None and last_day is None:
+        return None
+    return first_day, last_day
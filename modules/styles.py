@@ -0,0 +1,72 @@
+# Third-Party Library Imports
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side, numbers
+from openpyxl.utils import get_column_letter
+
+# Local Application Imports
+import modules.config as config
+
+### Style Names ###
+
+HEADER = "Report Header"
+DATA = "Report Data"
+DATA_LEFT = "Report Data (Left)"
+CURRENCY = "Report Currency"
+DECIMAL = "Report Decimal"
+
+### Registry ###
+
+def create_named_style(name, bold=False, centered=True, number_format=None):
+    style = NamedStyle(name=name)
+    style.font = Font(color=config.FONT_COLOR, bold=bold)
+    if centered:
+        style.alignment = Alignment(horizontal="center")
+    style.fill = PatternFill(
+        start_color=config.CELL_COLOR,
+        end_color=config.CELL_COLOR,
+        fill_type="solid"
+    )
+    side = Side(style="thin", color=config.FONT_COLOR)
+    style.border = Border(left=side, right=side, top=side, bottom=side)
+    if number_format:
+        style.number_format = number_format
+    return style
+
+def register_report_styles(wb):
+    # Each style is created once per workbook and referenced by name afterwards
+    styles = [
+        create_named_style(HEADER, bold=True),
+        create_named_style(DATA),
+        create_named_style(DATA_LEFT, centered=False),
+        create_named_style(CURRENCY, number_format=numbers.FORMAT_CURRENCY_USD_SIMPLE),
+        create_named_style(DECIMAL, number_format="0.00")
+    ]
+    for style in styles:
+        if style.name not in wb.named_styles:
+            wb.add_named_style(style)
+
+def fix_style_ids(ws):
+    # Gives each report style its cell format index in registration order, so sheets written
+    # by separate workbooks (see excel_report.export_spreadsheet) agree on style ids.
+    # Must run before any other cell in the workbook is styled.
+    for name in [HEADER, DATA, DATA_LEFT, CURRENCY, DECIMAL]:
+        styled_cell(ws, None, name).style_id
+
+### Sheet Formatting ###
+
+def set_column_widths(ws, column_widths):
+    # Write-only worksheets require widths to be set before any rows
+    for i, width in enumerate(column_widths, start=1):
+        ws.column_dimensions[get_column_letter(i)].width = width
+
+def styled_cell(ws, value, style):
+    # Works for both regular and write-only worksheets
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style
+    return cell
+
+def append_header(ws, headers):
+    ws.append([styled_cell(ws, header, HEADER) for header in headers])
+
+def append_row(ws, row, column_styles):
+    ws.append([styled_cell(ws, value, style) for value, style in zip(row, column_styles)])
@@ -0,0 +1,141 @@
+# Standard Library Imports
+import argparse
+import os
+import random
+
+# Local Application Imports
+import modules.config as config
+import modules.data_io as data_io
+import modules.sales as sales
+
+### Synthetic Data ###
+
+# Product name, materials (name, amount, price), timeframe, yield, sell price
+SYNTHETIC_PRODUCTS = [
+    ["OG Kush", [["OG Kush Seed", 1, 30], ["Soil", 1, 10]], 4, 8, 38],
+    ["Sour Diesel", [["Sour Diesel Seed", 1, 35], ["Soil", 1, 10], ["Fertilizer", 1, 30]], 4, 8, 45],
+    ["Green Crack", [["Green Crack Seed", 1, 40], ["Long-Life Soil", 1, 30]], 5, 12, 49],
+    ["Granddaddy Purple", [["Granddaddy Purple Seed", 1, 45], ["Long-Life Soil", 1, 30]], 5, 12, 52],
+    ["Meth", [["Pseudo", 1, 60], ["Acid", 1, 40], ["Phosphorus", 1, 40]], 2, 10, 70],
+    ["Cocaine", [["Coca Seed", 1, 50], ["Gasoline", 1, 5], ["Soil", 1, 10]], 6, 9, 150]
+]
+
+SYNTHETIC_LOCATIONS = [
+    "Motel", "Park", "Parking Lot", "Alley", "Dock 3", "Gas Station", "Laundromat", "Casino", "Church", "Arcade"
+]
+
+SYNTHETIC_DISTRIBUTORS = ["Benji", "Molly", "Brad", "Jane", "Wei", "Leo"]
+
+def customer_count_for(sales_rows):
+    # Thousands of customers on the large runs, as in a long playthrough
+    return min(5000, max(20, sales_rows // 200))
+
+def product_rows():
+    return [
+        [name, "|".join(f"{m}:{amount}:{price}" for m, amount, price in materials), timeframe, yield_amount, price]
+        for name, materials, timeframe, yield_amount, price in SYNTHETIC_PRODUCTS
+    ]
+
+def random_products(rng, max_products, max_units):
+    chosen = rng.sample(SYNTHETIC_PRODUCTS, rng.randint(1, max_products))
+    return [[product[0], rng.randint(1, max_units), product[4]] for product in chosen]
+
+def generate_customers(rng, count):
+    customers = {}
+    for i in range(count):
+        customers[f"Customer {i + 1:05d}"] = {
+            "REGION": rng.choice(config.CUSTOMER_REGIONS),
+            "LOCATIONS": rng.sample(SYNTHETIC_LOCATIONS, rng.randint(1, 3)),
+            "RELATIONSHIP": rng.choice(config.RELATIONSHIP_OPTIONS)
+        }
+    return customers
+
+def sale_rows(rng, count, customers, days):
+    names = list(customers)
+    for i in range(count):
+        day = 1 + i * days // count
+        customer_name = rng.choice(names)
+        customer = customers[customer_name]
+        products = random_products(rng, 2, 6)
+        ask_value = sum(units * price for _, units, price in products)
+        # Customers pay around the asking price
+        total_sales = max(1, round(ask_value * rng.uniform(0.7, 1.4)))
+        yield sales.build_sale_row(
+            day,
+            customer_name,
+            products,
+            total_sales,
+            rng.choice(customer["LOCATIONS"]),
+            rng.choice(config.TIME_OF_DAY_OPTIONS),
+            customer["RELATIONSHIP"]
+        )
+
+def distributor_sale_rows(rng, count, days):
+    for i in range(count):
+        day = 1 + i * days // count
+        products = random_products(rng, 3, 25)
+        ask_value = sum(units * price for _, units, price in products)
+        yield sales.build_distributor_sale_row(
+            day,
+            rng.choice(SYNTHETIC_DISTRIBUTORS),
+            products,
+            max(1, round(ask_value * rng.uniform(0.6, 1.1))),
+            rng.random() < 0.5
+        )
+
+def generate_dataset(directory, sales_rows, distributor_rows=None, days=None, seed=0):
+    # Writes the CSV files under directory (using the relative paths in config); the same
+    # arguments always produce the same files
+    rng = random.Random(seed)
+    if distributor_rows is None:
+        distributor_rows = max(1, sales_rows // 10)
+    if days is None:
+        days = max(1, sales_rows // 50)
+
+    def path(file_name):
+        return os.path.join(directory, file_name)
+
+    os.makedirs(os.path.dirname(path(config.SALES_DATA_CSV)), exist_ok=True)
+    customers = generate_customers(rng, customer_count_for(sales_rows))
+
+    data_io.write_csv(path(config.PRODUCT_DATA_CSV), product_rows(), headers=config.PRODUCT_DATA_HEADERS)
+    data_io.write_csv(
+        path(config.PRODUCT_NAMES_CSV),
+        [[name] for name in sorted(product[0] for product in SYNTHETIC_PRODUCTS)],
+        headers=["PRODUCT"]
+    )
+    data_io.write_csv(
+        path(config.CUSTOMER_DATA_CSV),
+        [
+            [name, data["REGION"], "|".join(sorted(data["LOCATIONS"])), data["RELATIONSHIP"]]
+            for name, data in customers.items()
+        ],
+        headers=config.CUSTOMER_DATA_HEADERS
+    )
+    data_io.write_csv(
+        path(config.DISTRIBUTOR_NAMES_CSV),
+        [[name] for name in SYNTHETIC_DISTRIBUTORS],
+        headers=["DISTRIBUTOR"]
+    )
+    data_io.write_csv(
+        path(config.SALES_DATA_CSV),
+        sale_rows(rng, sales_rows, customers, days),
+        headers=config.RAW_DATA_REPORT_HEADERS
+    )
+    data_io.write_csv(
+        path(config.DISTRIBUTOR_SALES_DATA_CSV),
+        distributor_sale_rows(rng, distributor_rows, days),
+        headers=config.RAW_DISTRIBUTOR_DATA_REPORT_HEADERS
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a deterministic synthetic data set.")
+    parser.add_argument("directory", help="directory to write csv/ into")
+    parser.add_argument("--sales", type=int, default=10000, help="customer sale rows")
+    parser.add_argument("--distributor-sales", type=int, help="distributor sale rows (default: sales / 10)")
+    parser.add_argument("--days", type=int, help="days covered (default: sales / 50)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generate_dataset(args.directory, args.sales, args.distributor_sales, args.days, args.seed)
+    print(f"Synthetic data written to {args.directory}.")
@@ -0,0 +1,284 @@
+# Standard Library Imports
+import math
+import os
+import sys
+import time
+
+# Third-Party Library Imports
+import numpy as np
+import pandas as pd
+
+# Local Application Imports
+import modules.aggregation as aggregation
+import modules.config as config
+import modules.data_io as data_io
+import modules.records as records
+import modules.sketch as sketch
+
+### Loading ###
+
+SALES_DTYPES = {
+    "DAY": "int64",
+    "CUSTOMER": "category",
+    "UNITS SOLD": "int64",
+    "TOTAL SALES": "float64",
+    "REAL RATE": "float64",
+    "ASK RATE": "float64",
+    "PRODUCTS": "category",
+    "LOCATION": "category",
+    "TIME OF DAY": "category",
+    "RELATIONSHIP": "category"
+}
+
+DISTRIBUTOR_DTYPES = {
+    "DAY": "int64",
+    "DISTRIBUTOR": "category",
+    "UNITS SOLD": "int64",
+    "GROSS SALES": "float64",
+    "NET SALES": "float64",
+    "REAL RATE": "float64",
+    "ASK RATE": "float64",
+    "PRODUCTS": "category"
+}
+
+def load_frame(file_names, headers, dtypes):
+    # file_names is one log or its day partitions, read in order
+    if isinstance(file_names, str):
+        file_names = [file_names]
+    for file_name in file_names:
+        data_io.flush_appends(file_name)
+    # Columns are named by position, like the row-based builders; text columns are
+    # categorical, so repeated names are grouped by integer code; empty strings stay strings
+    frames = [
+        pd.read_csv(
+            file_name,
+            header=0,
+            names=headers,
+            dtype=dtypes,
+            keep_default_na=False
+        )
+        for file_name in file_names if os.path.exists(file_name)
+    ]
+    if not frames:
+        return pd.DataFrame({name: pd.Series(dtype=dtypes[name]) for name in headers})
+    if len(frames) == 1:
+        return frames[0]
+    # Each file has its own categories, so they are rebuilt after concatenating
+    return pd.concat(frames, ignore_index=True).astype(dtypes)
+
+def load_sales_frame(file_name=config.SALES_DATA_CSV):
+    return load_frame(file_name, config.RAW_DATA_REPORT_HEADERS, SALES_DTYPES)
+
+def load_distributor_frame(file_name=config.DISTRIBUTOR_SALES_DATA_CSV):
+    return load_frame(file_name, config.RAW_DISTRIBUTOR_DATA_REPORT_HEADERS, DISTRIBUTOR_DTYPES)
+
+def explode_products(df, largest_first=True):
+    # One row per "NAME:UNITS:PRICE" entry, with the position of the sale it came from.
+    # Logs repeat a small set of product strings, so each distinct string is parsed once
+    # and its entries are fanned back out to the sales with index arithmetic.
+    codes, uniques = pd.factorize(df["PRODUCTS"])
+    name_codes = {}
+    names = []
+    units = []
+    shares = []
+    entry_counts = []
+    for products_string in uniques:
+        parsed_products = data_io.parse_products_string(products_string)
+        if largest_first:
+            # Largest entry first within each sale (stable), matching add_sale
+            parsed_products.sort(key=lambda x: x[1], reverse=True)
+        entry_counts.append(len(parsed_products))
+        total_units = sum(product_units for _, product_units, _ in parsed_products)
+        for name, product_units, _ in parsed_products:
+            names.append(name_codes.setdefault(name, len(name_codes)))
+            units.append(product_units)
+            # Each product's share of the sale's units, for the product sales split
+            shares.append(product_units / total_units if total_units else 0)
+
+    entry_counts = np.array(entry_counts, dtype=np.int64)
+    entry_starts = np.cumsum(entry_counts) - entry_counts
+    sale_counts = entry_counts[codes]
+    sale_starts = np.cumsum(sale_counts) - sale_counts
+    entries = np.repeat(entry_starts[codes], sale_counts)
+    entries += np.arange(len(entries)) - np.repeat(sale_starts, sale_counts)
+
+    return pd.DataFrame({
+        "SALE": np.repeat(np.arange(len(codes)), sale_counts),
+        "NAME": pd.Categorical.from_codes(np.array(names, dtype=np.int64)[entries], list(name_codes)),
+        "UNITS": np.array(units, dtype=np.int64)[entries],
+        "SHARE": np.array(shares, dtype=np.float64)[entries]
+    })
+
+### Aggregation ###
+
+def index_levels(grouped):
+    # Group keys as one list per level (cheaper than building tuples for every group)
+    index = grouped.index
+    return [index.get_level_values(level).tolist() for level in range(index.nlevels)]
+
+def add_day_products(report, products, key):
+    # Groups come out in first-appearance order, so Counter ties match the row-based builders
+    day_products = products.groupby(["DAY", "NAME"], sort=False, observed=True)["UNITS"].sum()
+    for day, name, units in zip(*index_levels(day_products), day_products.tolist()):
+        report["daily"][day][key][name] = units
+
+def build_report_data(sales, distributors):
+    report = aggregation.new_report_data()
+    sales = sales.reset_index(drop=True)
+    distributors = distributors.reset_index(drop=True)
+
+    products = explode_products(sales)
+    products["DAY"] = sales["DAY"].to_numpy()[products["SALE"].to_numpy()]
+
+    # Daily summary
+    daily = sales.groupby("DAY", sort=False).agg(
+        my_sales=("TOTAL SALES", "sum"),
+        my_units_sold=("UNITS SOLD", "sum"),
+        deals=("UNITS SOLD", "size")
+    )
+    for day, my_sales, my_units_sold, deals in zip(
+        daily.index.tolist(),
+        daily["my_sales"].tolist(),
+        daily["my_units_sold"].tolist(),
+        daily["deals"].tolist()
+    ):
+        day_summary = report["daily"][day]
+        day_summary["my_sales"] = my_sales
+        day_summary["my_units_sold"] = my_units_sold
+        day_summary["deals"] = deals
+    add_day_products(report, products, "products")
+
+    day_customers = sales.groupby(["DAY", "CUSTOMER"], sort=False, observed=True).agg(
+        sales=("TOTAL SALES", "sum"),
+        units=("UNITS SOLD", "sum")
+    )
+    for day, name, sales_total, units in zip(
+        *index_levels(day_customers),
+        day_customers["sales"].tolist(),
+        day_customers["units"].tolist()
+    ):
+        report["daily"][day]["customer_data"][name] = {"sales": sales_total, "units": units}
+
+    # Customer summary
+    customers = sales.groupby("CUSTOMER", sort=False, observed=True).agg(
+        total_sales=("TOTAL SALES", "sum"),
+        units_total=("UNITS SOLD", "sum"),
+        deals=("UNITS SOLD", "size"),
+        rate_total=("REAL RATE", "sum"),
+        relationship=("RELATIONSHIP", "last")
+    )
+    for name, total_sales, units_total, deals, rate_total, relationship in zip(
+        customers.index.tolist(),
+        customers["total_sales"].tolist(),
+        customers["units_total"].tolist(),
+        customers["deals"].tolist(),
+        customers["rate_total"].tolist(),
+        customers["relationship"].tolist()
+    ):
+        customer = report["customers"][name]
+        customer["total_sales"] = total_sales
+        customer["units_total"] = units_total
+        customer["deals"] = deals
+        customer["rate_total"] = rate_total
+        customer["relationship"] = relationship
+
+    for column, key in (("TIME OF DAY", "times_of_day"), ("LOCATION", "locations")):
+        counts = sales.groupby(["CUSTOMER", column], sort=False, observed=True).size()
+        for name, value, count in zip(*index_levels(counts), counts.tolist()):
+            report["customers"][name][key][value] = count
+
+    # Percentile sketches: each distinct value is bucketed once, then buckets are counted per customer
+    for column, key in (("TOTAL SALES", "sale_sketch"), ("REAL RATE", "rate_sketch")):
+        codes, values = pd.factorize(sales[column])
+        buckets = np.array([sketch.bucket_index(value) for value in values.tolist()], dtype=np.int64)
+        counts = sales.assign(BUCKET=buckets[codes]).groupby(["CUSTOMER", "BUCKET"], sort=False, observed=True).size()
+        for name, index, count in zip(*index_levels(counts), counts.tolist()):
+            report["customers"][name][key].add_bucket(index, count)
+        bounds = sales.groupby("CUSTOMER", sort=False, observed=True)[column].agg(["min", "max"])
+        for name, minimum, maximum in zip(bounds.index.tolist(), bounds["min"].tolist(), bounds["max"].tolist()):
+            report["customers"][name][key].add_bounds(minimum, maximum)
+
+    # Product summary (sale total split by each product's share of units)
+    products["SALES"] = sales["TOTAL SALES"].to_numpy()[products["SALE"].to_numpy()] * products["SHARE"]
+    product_totals = products.groupby("NAME", sort=False, observed=True).agg(
+        sales=("SALES", "sum"),
+        units=("UNITS", "sum")
+    )
+    for name, sales_total, units in zip(
+        product_totals.index.tolist(),
+        product_totals["sales"].tolist(),
+        product_totals["units"].tolist()
+    ):
+        report["products"][name] = {"sales": sales_total, "units": units}
+
+    # Distributor sales only feed the daily summary
+    distributor_daily = distributors.groupby("DAY", sort=False).agg(
+        distributor_sales=("GROSS SALES", "sum"),
+        distributor_units_sold=("UNITS SOLD", "sum")
+    )
+    for day, distributor_sales, distributor_units_sold in zip(
+        distributor_daily.index.tolist(),
+        distributor_daily["distributor_sales"].tolist(),
+        distributor_daily["distributor_units_sold"].tolist()
+    ):
+        day_summary = report["daily"][day]
+        day_summary["distributor_sales"] = distributor_sales
+        day_summary["distributor_units_sold"] = distributor_units_sold
+
+    # Distributor entries keep their logged order, matching add_distributor_sale
+    distributor_products = explode_products(distributors, largest_first=False)
+    distributor_products["DAY"] = distributors["DAY"].to_numpy()[distributor_products["SALE"].to_numpy()]
+    add_day_products(report, distributor_products, "distributor_products")
+
+    return report
+
+def build_report_data_from_csv(sales_files=config.SALES_DATA_CSV, distributor_files=config.DISTRIBUTOR_SALES_DATA_CSV):
+    return build_report_data(load_sales_frame(sales_files), load_distributor_frame(distributor_files))
+
+### Parity Check ###
+
+def compare_values(path, expected, actual, differences):
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        # Key order matters: it decides how ties are listed in the report
+        if list(expected) != list(actual):
+            differences.append(f"{path}: keys {list(expected)} != {list(actual)}")
+            return
+        for key in expected:
+            compare_values(f"{path}.{key}", expected[key], actual[key], differences)
+    elif isinstance(expected, float) or isinstance(actual, float):
+        # Grouped sums may add floats in a different order
+        if not math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-9):
+            differences.append(f"{path}: {expected!r} != {actual!r}")
+    elif expected != actual:
+        differences.append(f"{path}: {expected!r} != {actual!r}")
+
+def compare_reports(expected, actual):
+    differences = []
+    compare_values("report", expected, actual, differences)
+    return differences
+
+def check_parity(sales_file=config.SALES_DATA_CSV, distributor_file=config.DISTRIBUTOR_SALES_DATA_CSV):
+    # Both timings include reading the logs, the same way each export path does
+    start = time.perf_counter()
+    expected = aggregation.build_report_data(
+        records.sale_records(data_io.iter_csv_rows(sales_file)),
+        records.distributor_sale_records(data_io.iter_csv_rows(distributor_file))
+    )
+    python_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = build_report_data_from_csv(sales_file, distributor_file)
+    pandas_time = time.perf_counter() - start
+
+    differences = compare_reports(expected, actual)
+    sales_count = sum(day["deals"] for day in expected["daily"].values())
+    print(f"python: {python_time:.3f}s, pandas: {pandas_time:.3f}s ({sales_count} sales)")
+    return differences
+
+if __name__ == "__main__":
+    # Usage: python -m modules.vectorized [SALES_CSV DISTRIBUTOR_CSV]
+    differences = check_parity(*sys.argv[1:3])
+    for difference in differences[:20]:
+        print(difference)
+    print("Parity check failed." if differences else "Parity check passed.")
+    sys.exit(1 if differences else 0)
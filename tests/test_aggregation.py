@@ -0,0 +1,65 @@
+# Standard Library Imports
+import csv
+import os
+import tempfile
+import unittest
+
+# Local Application Imports
+import modules.aggregation as aggregation
+import modules.config as config
+import modules.data_io as data_io
+import modules.records as records
+import modules.synthetic_data as synthetic_data
+import modules.vectorized as vectorized
+
+class IncrementalReportTests(unittest.TestCase):
+    # The checkpointed report must always match a rebuild from the whole log
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory(prefix="checkpoint_")
+        synthetic_data.generate_dataset(self.directory.name, 5000)
+        self.sales_file = os.path.join(self.directory.name, config.SALES_DATA_CSV)
+        self.distributor_file = os.path.join(self.directory.name, config.DISTRIBUTOR_SALES_DATA_CSV)
+        self.checkpoint_file = os.path.join(self.directory.name, "checkpoint.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def build_incremental(self):
+        return aggregation.build_incremental_report_data(
+            [self.sales_file], [self.distributor_file], self.checkpoint_file
+        )
+
+    def build_full(self):
+        return aggregation.build_report_data(
+            records.sale_records(data_io.iter_csv_rows(self.sales_file)),
+            records.distributor_sale_records(data_io.iter_csv_rows(self.distributor_file))
+        )
+
+    def test_same_length_edit_in_the_middle_rebuilds(self):
+        self.build_incremental()
+
+        # Rename the customer of the middle sale without changing the file size
+        with open(self.sales_file, mode="r", newline="") as file:
+            rows = list(csv.reader(file))
+        middle = rows[len(rows) // 2]
+        middle[1] = middle[1].swapcase()
+        size = os.path.getsize(self.sales_file)
+        with open(self.sales_file, mode="w", newline="") as file:
+            csv.writer(file).writerows(rows)
+        self.assertEqual(os.path.getsize(self.sales_file), size)
+
+        report = self.build_incremental()
+        self.assertEqual(vectorized.compare_reports(self.build_full(), report), [])
+
+    def test_appended_sales_resume_from_the_checkpoint(self):
+        self.build_incremental()
+        with open(self.sales_file, mode="r", newline="") as file:
+            rows = list(csv.reader(file))
+        with open(self.sales_file, mode="a", newline="") as file:
+            csv.writer(file).writerows(rows[1:11])
+
+        report = self.build_incremental()
+        self.assertEqual(vectorized.compare_reports(self.build_full(), report), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+# Standard Library Imports
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# Local Application Imports
+import modules.catalog as catalog
+import modules.config as config
+import modules.synthetic_data as synthetic_data
+
+class ProductEconomicsCacheTests(unittest.TestCase):
+    # Config paths are relative, so each test runs inside a generated data set
+    def setUp(self):
+        self.original_directory = os.getcwd()
+        self.directory = tempfile.TemporaryDirectory(prefix="catalog_")
+        synthetic_data.generate_dataset(self.directory.name, 100)
+        os.chdir(self.directory.name)
+
+    def tearDown(self):
+        os.chdir(self.original_directory)
+        self.directory.cleanup()
+
+    def test_unchanged_product_data_is_not_parsed_again(self):
+        first = catalog.load_product_catalog()
+        with mock.patch.object(catalog, "parse_materials", side_effect=AssertionError("parsed")):
+            second = catalog.load_product_catalog()
+        self.assertEqual(list(second), list(first))
+        self.assertEqual(second.product_economics, first.product_economics)
+
+    def test_edits_update_the_cache(self):
+        product_catalog = catalog.load_product_catalog()
+        name = product_catalog.names()[0]
+        product_catalog.update(name, sell_price=product_catalog.price(name) + 10)
+
+        reloaded = catalog.load_product_catalog()
+        self.assertEqual(reloaded.price(name), product_catalog.price(name))
+        self.assertEqual(reloaded.economics(name), catalog.ProductEconomics.of(product_catalog.get(name)))
+
+    def test_product_data_edited_outside_the_menus_is_picked_up(self):
+        product_catalog = catalog.load_product_catalog()
+        product = product_catalog.get(product_catalog.names()[0])
+        with open(config.PRODUCT_DATA_CSV, mode="a") as file:
+            file.write(f"New Product,{catalog.serialize_materials(product.materials)},2,4,99\n")
+
+        reloaded = catalog.load_product_catalog()
+        self.assertEqual(reloaded.price("New Product"), 99)
+        self.assertEqual(reloaded.economics("New Product").profit_per_hour, catalog.ProductEconomics.of(
+            reloaded.get("New Product")
+        ).profit_per_hour)
+
+if __name__ == "__main__":
+    unittest.main()
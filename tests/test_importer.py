@@ -0,0 +1,70 @@
+# Standard Library Imports
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+# Local Application Imports
+import modules.catalog as catalog
+import modules.importer as importer
+
+class ReadRecordsTests(unittest.TestCase):
+    def test_jsonl_lines_that_are_not_objects_are_bad_rows(self):
+        with tempfile.TemporaryDirectory(prefix="import_") as directory:
+            file_name = os.path.join(directory, "sales.jsonl")
+            with open(file_name, mode="w") as file:
+                file.write('[1, 2]\n"x"\n3\n{bad\n\n{"DAY": 4, "Customer": "Ann"}\n')
+            records = list(importer.read_records(file_name))
+
+        self.assertEqual(records, [
+            (1, None),
+            (2, None),
+            (3, None),
+            (4, None),
+            (6, {"day": 4, "customer": "Ann"})
+        ])
+
+class ImportSalesFileTests(unittest.TestCase):
+    # Values of the wrong JSON type are reported per line instead of raising
+    def import_record(self, **fields):
+        record = {
+            "type": "customer",
+            "day": 1,
+            "customer": "Ann",
+            "region": "Northtown",
+            "location": "Park",
+            "time_of_day": "6AM-12PM",
+            "relationship": "Neutral",
+            "total_sales": 100,
+            "products": [["Widget", 2]],
+            **fields
+        }
+        with tempfile.TemporaryDirectory(prefix="import_") as directory:
+            file_name = os.path.join(directory, "sales.jsonl")
+            with open(file_name, mode="w") as file:
+                file.write(json.dumps(record) + "\n")
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                result = importer.import_sales_file(
+                    file_name, [catalog.Product("Widget", sell_price=50)], {}, set()
+                )
+        self.assertIsNone(result)
+        return output.getvalue()
+
+    def test_product_entries_that_are_not_pairs(self):
+        self.assertIn("line 1: invalid product entry 1", self.import_record(products=[1, 2]))
+
+    def test_product_names_that_are_not_strings(self):
+        self.assertIn("line 1: invalid product name ['a']", self.import_record(products=[[["a"], 1]]))
+
+    def test_customers_that_are_not_strings(self):
+        self.assertIn("line 1: invalid customer {'a': 1}", self.import_record(customer={"a": 1}))
+
+    def test_distributors_that_are_not_strings(self):
+        output = self.import_record(type="distributor", distributor=["x"], cut_included=True)
+        self.assertIn("line 1: invalid distributor ['x']", output)
+
+if __name__ == "__main__":
+    unittest.main()
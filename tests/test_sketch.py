@@ -0,0 +1,55 @@
+# Standard Library Imports
+import random
+import unittest
+
+# Local Application Imports
+import modules.sketch as sketch
+
+def build_sketch(values):
+    quantile_sketch = sketch.QuantileSketch()
+    for value in values:
+        quantile_sketch.add(value)
+    return quantile_sketch
+
+def exact_quantile(values, q):
+    values = sorted(values)
+    rank = q * (len(values) - 1)
+    position = int(rank)
+    if position + 1 == len(values):
+        return values[position]
+    return values[position] + (rank - position) * (values[position + 1] - values[position])
+
+class QuantileSketchTests(unittest.TestCase):
+    def test_single_value_is_exact(self):
+        quantile_sketch = build_sketch([100])
+        self.assertEqual(quantile_sketch.quantile(0.5), 100)
+        self.assertEqual(quantile_sketch.quantile(0.9), 100)
+
+    def test_two_values_interpolate_between_bounds(self):
+        quantile_sketch = build_sketch([10, 20])
+        self.assertEqual(quantile_sketch.quantile(0.5), 15)
+        self.assertAlmostEqual(quantile_sketch.quantile(0.9), 19)
+
+    def test_quantiles_stay_within_accuracy(self):
+        generator = random.Random(7)
+        values = [generator.lognormvariate(5, 1) for _ in range(5000)]
+        quantile_sketch = build_sketch(values)
+        for q in (0.1, 0.5, 0.9, 0.99):
+            exact = exact_quantile(values, q)
+            self.assertLessEqual(abs(quantile_sketch.quantile(q) - exact) / exact, 0.011)
+
+    def test_merge_matches_single_sketch(self):
+        values = [30 + i * 7 % 900 for i in range(1000)]
+        merged = build_sketch(values[:400])
+        merged.merge(build_sketch(values[400:]))
+        self.assertEqual(merged, build_sketch(values))
+
+    def test_json_round_trip(self):
+        quantile_sketch = build_sketch([0, 35.5, 120, 980])
+        self.assertEqual(sketch.QuantileSketch.from_json(quantile_sketch.to_json()), quantile_sketch)
+
+    def test_empty_sketch(self):
+        self.assertEqual(sketch.QuantileSketch().quantile(0.5), 0.0)
+
+if __name__ == "__main__":
+    unittest.main()
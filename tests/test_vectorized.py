@@ -0,0 +1,37 @@
+# Standard Library Imports
+import os
+import tempfile
+import unittest
+
+# Local Application Imports
+import modules.aggregation as aggregation
+import modules.config as config
+import modules.data_io as data_io
+import modules.records as records
+import modules.synthetic_data as synthetic_data
+import modules.vectorized as vectorized
+
+class ParityTests(unittest.TestCase):
+    # The pandas engine must build exactly the report the row-by-row aggregation builds
+    def check_seed(self, seed):
+        with tempfile.TemporaryDirectory(prefix="parity_") as directory:
+            synthetic_data.generate_dataset(directory, 2000, seed=seed)
+            sales_file = os.path.join(directory, config.SALES_DATA_CSV)
+            distributor_file = os.path.join(directory, config.DISTRIBUTOR_SALES_DATA_CSV)
+
+            expected = aggregation.build_report_data(
+                records.sale_records(data_io.iter_csv_rows(sales_file)),
+                records.distributor_sale_records(data_io.iter_csv_rows(distributor_file))
+            )
+            actual = vectorized.build_report_data_from_csv([sales_file], [distributor_file])
+
+        self.assertTrue(expected["customers"])
+        self.assertEqual(vectorized.compare_reports(expected, actual), [])
+
+    def test_engines_match(self):
+        for seed in (0, 1):
+            with self.subTest(seed=seed):
+                self.check_seed(seed)
+
+if __name__ == "__main__":
+    unittest.main()